@@ -1,9 +1,29 @@
 # You can initialize package-wide variables
 VERSION = '1.0.0'
 
-# Import commonly used classes to make them easier to import elsewhere
-from .bot import TradingBot
-from .bot_ui import TradingBotUI
+# Optional drop-in accelerator for pandas rolling/ewm kernels; purely
+# additive, so it's fine for it not to be installed
+try:
+    import unlockedpd  # noqa: F401
+except ImportError:
+    pass
+
+# Lazily re-export the commonly used classes (PEP 562). Importing the
+# package stays cheap; the heavy pandas/numpy/yfinance stack only loads
+# on the first attribute access, which keeps window startup fast.
+def __getattr__(name):
+    if name == 'TradingBot':
+        from .bot import TradingBot
+        # Compile the indicator kernels now that the bot is actually
+        # wanted (no-op without numba) so the first tick after Start
+        # doesn't stall on JIT compilation
+        from .utils.indicator_kernels import warmup as _warmup_kernels
+        _warmup_kernels()
+        return TradingBot
+    if name == 'TradingBotUI':
+        from .bot_ui import TradingBotUI
+        return TradingBotUI
+    raise AttributeError(f"module 'src' has no attribute {name!r}")
 
 # This allows users to do:
 # from src import TradingBot
@@ -1,126 +1,576 @@
 # core logic
+import asyncio
+import logging
+import os
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
 import yfinance as yf
 import pandas as pd
 import ta
 import time
-from datetime import datetime
-from src.utils.strategies import TradingStrategies, Signal
+from collections import deque
+import numpy as np
+from src.utils.strategies import (TradingStrategies, Signal,
+                                  KIND_NONE, KIND_BUY)
+from src.utils.cache import DataCache, INTERVAL_SECONDS
+from src.utils import indicator_kernels as kernels
+from src.utils._njit import HAVE_NUMBA
+
+# Shared across bots so switching symbols keeps earlier fetches warm
+_data_cache = DataCache()
+
+# One pooled HTTP session shared by every bot: keep-alive connection reuse
+# saves a TCP+TLS handshake on each poll vs. a fresh per-Ticker session
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Per-tick diagnostics go to DEBUG so production runs skip them entirely
+log = logging.getLogger(__name__)
+
+# Small on-disk snapshots of per-symbol hot state live here
+_STATE_DIR = '.cache'
 
 class TradingBot:
+    # Ring-buffer capacity, sized past the longest lookback (26 for
+    # MACD); also how many computed rows a state snapshot keeps
+    _BUF_SIZE = 64
+
     def __init__(self, symbol, interval='1m'):
         self.symbol = symbol.upper()
         self.interval = interval
         self.position = False  # False = no position, True = has position
         self.strategies = TradingStrategies()
         self.min_signal_strength = 0.3  # Minimum signal strength threshold
-        
+        self.require_confirmation = False  # True = always evaluate every strategy
+        # Indicator configuration never changes per tick, so it lives here
+        # instead of being re-packed into ta indicator objects every call
+        self._rsi_period = 14
+        self._macd_fast = 12
+        self._macd_slow = 26
+        self._macd_sign = 9
+        self._bb_window = 20
+        self._vol_window = 20
+        # Streaming buffer: the day's bars accumulate here so later ticks
+        # only need to fetch the delta since the last bar we hold
+        self._df = None
+        self._last_ts = None
+        self._fetched_at = 0.0
+        # Timestamp of the bar the hot buffers were last seeded on, so
+        # the step path can tell whether they cover the frame at hand
+        self._buf_ts = None
+        # SoA hot state: the most recent closes/volumes live in small
+        # contiguous ring buffers, so per-bar indicator math never
+        # touches the DataFrame
+        self._close_buf = kernels.RingBuffer(self._BUF_SIZE, dtype=np.float64)
+        self._volume_buf = kernels.RingBuffer(self._BUF_SIZE, dtype=np.int64)
+        # Running 20-bar volume sum: reading the live average is O(1)
+        # instead of copying and re-summing the window every step
+        self._vol_mean = kernels.RollingMean(self._vol_window)
+        self._tick_count = 0
+        # Incremental indicator state: after one full compute seeds the
+        # Wilder/EMA accumulators, each new bar is folded in with O(1)
+        # step updates instead of recomputing the whole day
+        self._ind_state = None
+        self._calc_df = None
+        # Rolling (macd, signal) pairs for the UI chart: the chart shows
+        # 30 bars, so the step path can feed it without the UI slicing
+        # whole DataFrame columns every repaint
+        self.macd_history = deque(maxlen=30)
+        self._load_state()
+
     @property
     def symbol(self):
         return self._symbol
-    
+
     @symbol.setter
     def symbol(self, new_symbol):
         """Allow changing the symbol after initialization"""
-        self._symbol = new_symbol.upper()
-    
+        new_symbol = new_symbol.upper()
+        if getattr(self, '_symbol', None) != new_symbol:
+            # Different ticker: the streaming buffers no longer apply
+            self._df = None
+            self._last_ts = None
+            self._fetched_at = 0.0
+            self._buf_ts = None
+            if hasattr(self, '_close_buf'):
+                self._close_buf.seed(())
+                self._volume_buf.seed(())
+                self._vol_mean.seed(())
+            if hasattr(self, '_ind_state'):
+                self._ind_state = None
+                self._calc_df = None
+                self.macd_history.clear()
+        self._symbol = new_symbol
+
+    @staticmethod
+    def _trim(df):
+        """Keep only the columns the live strategies read, downcast dtypes"""
+        # The live strategies only read Close and Volume; dropping the
+        # unused OHL columns means every downstream op scans less memory.
+        # Downcasting from float64/int64 halves memory so the rolling
+        # indicator scans stay cache-resident.
+        return df[['Close', 'Volume']].astype({'Close': 'float32',
+                                               'Volume': 'int32'})
+
+    def _buffer_fresh(self):
+        """True while no new bar can exist upstream since the last fetch"""
+        bar_seconds = INTERVAL_SECONDS.get(self.interval, 60)
+        next_bar_close = (self._fetched_at // bar_seconds + 1) * bar_seconds
+        return time.time() < next_bar_close
+
     def get_data(self):
-        """Fetch real-time stock data"""
+        """Fetch real-time stock data, requesting only bars we don't hold yet"""
         try:
-            ticker = yf.Ticker(self.symbol)
-            df = ticker.history(period='1d', interval=self.interval)
-            if df.empty:
-                raise Exception("No data received from yfinance")
-            print(f"Fetched {len(df)} rows of data")  # Debug print
-            return df
+            if self._df is not None:
+                if self._buffer_fresh():
+                    return self._df
+
+                # Delta fetch: ask for bars from the last held timestamp on;
+                # the last bar may have been intrabar, so dedupe keeps the
+                # newer copy of any overlapping timestamp
+                ticker = yf.Ticker(self.symbol, session=_SESSION)
+                new = ticker.history(start=self._last_ts, interval=self.interval)
+                self._fetched_at = time.time()
+                if not new.empty:
+                    log.debug("Fetched %d delta rows", len(new))
+                    combined = pd.concat([self._df, self._trim(new)])
+                    self._df = combined[~combined.index.duplicated(keep='last')]
+                    self._last_ts = self._df.index[-1]
+                    self._reseed_buffers()
+                    self._tick_count += 1
+                    if self._tick_count % 10 == 0:
+                        self.save_state()
+                return self._df
+
+            cached = _data_cache.get(self.symbol, self.interval)
+            if cached is None:
+                ticker = yf.Ticker(self.symbol, session=_SESSION)
+                cached = ticker.history(period='1d', interval=self.interval)
+                if cached.empty:
+                    raise Exception("No data received from yfinance")
+                log.debug("Fetched %d rows of data", len(cached))
+                cached = self._trim(cached)
+                _data_cache.put(self.symbol, self.interval, cached)
+
+            self._df = cached
+            self._last_ts = cached.index[-1]
+            self._fetched_at = time.time()
+            self._reseed_buffers()
+            return self._df
         except Exception as e:
-            print(f"Error fetching data: {e}")
+            log.error("Error fetching data: %s", e)
             return None
-    
+
+    def _state_path(self):
+        return os.path.join(_STATE_DIR, f"{self.symbol}_{self.interval}_state.npz")
+
+    # Computed columns persisted in a state snapshot, in frame order
+    _STATE_COLUMNS = ['Close', 'Volume', 'RSI', 'MACD', 'MACD_signal',
+                      'BB_high', 'BB_low', 'Volume_MA20']
+    # Indicator accumulators persisted as one flat float array
+    _STATE_KEYS = ['prev_close', 'avg_gain', 'avg_loss',
+                   'ema_fast', 'ema_slow', 'ema_sig']
+
+    def save_state(self):
+        """Snapshot the streaming state to disk (tmpfile + rename).
+
+        Persists the tail of the computed frame, the incremental
+        indicator accumulators and the fetch bookkeeping, so a restarted
+        bot delta-fetches from its last held bar and resumes O(1) step
+        updates instead of refetching and recomputing the whole day.
+        """
+        if self._calc_df is None or self._ind_state is None:
+            return  # Nothing computed yet; nothing worth resuming from
+        try:
+            os.makedirs(_STATE_DIR, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=_STATE_DIR, suffix='.tmp.npz')
+            os.close(fd)
+            tail = self._calc_df.iloc[-self._BUF_SIZE:]
+            np.savez(tmp,
+                     index=tail.index.asi8,
+                     tz=str(tail.index.tz),
+                     fetched_at=self._fetched_at,
+                     ind_state=np.array([self._ind_state[k]
+                                         for k in self._STATE_KEYS]),
+                     **{col: tail[col].to_numpy()
+                        for col in self._STATE_COLUMNS})
+            os.replace(tmp, self._state_path())
+        except OSError as e:
+            log.debug("Could not save state snapshot: %s", e)
+
+    def _load_state(self):
+        """Resume streaming state from a fresh on-disk snapshot, if any.
+
+        Restores the computed tail and the indicator accumulators, so
+        the first get_data() takes the delta-fetch branch and
+        calculate_signals can step instead of recomputing the day.
+        """
+        path = self._state_path()
+        try:
+            if not os.path.exists(path):
+                return
+            bar_seconds = INTERVAL_SECONDS.get(self.interval, 60)
+            if time.time() - os.path.getmtime(path) > bar_seconds:
+                return  # Stale: a fetch will reseed everything anyway
+            data = np.load(path)
+            # asi8 is UTC nanoseconds; rebuild the tz-aware index
+            index = pd.DatetimeIndex(data['index'].view('datetime64[ns]'))
+            tz = str(data['tz'])
+            if tz != 'None':
+                index = index.tz_localize('UTC').tz_convert(tz)
+            calc_df = pd.DataFrame(
+                {col: data[col] for col in self._STATE_COLUMNS}, index=index)
+            ind_state = dict(zip(self._STATE_KEYS,
+                                 data['ind_state'].tolist()))
+        except Exception as e:
+            log.debug("Could not load state snapshot: %s", e)
+            return
+        self._calc_df = calc_df
+        self._ind_state = ind_state
+        self._df = calc_df[['Close', 'Volume']]
+        self._last_ts = index[-1]
+        self._fetched_at = float(data['fetched_at'])
+        self._reseed_buffers(calc_df)
+        pairs = calc_df[['MACD', 'MACD_signal']].to_numpy()[-self.macd_history.maxlen:]
+        self.macd_history.extend(map(tuple, pairs.tolist()))
+
+    def _reseed_buffers(self, df=None):
+        """Refill the hot-state ring buffers from the tail of a frame.
+
+        The last held bar can change intrabar, so a straight push per new
+        row isn't safe; refilling 64 values per tick is still trivial next
+        to any DataFrame scan.
+        """
+        if df is None:
+            df = self._df
+        volumes = df['Volume'].to_numpy(dtype=np.int64)
+        self._close_buf.seed(df['Close'].to_numpy(dtype=np.float64))
+        self._volume_buf.seed(volumes)
+        self._vol_mean.seed(volumes)
+        self._buf_ts = df.index[-1]
+
+    def _can_step(self, df):
+        """True when df extends the last computed frame by exactly one bar"""
+        # bb_step reads a full Bollinger window unconditionally, so a
+        # frame still shorter than that must take the full recompute
+        # (which handles short histories with NaN lead-ins)
+        return (self._ind_state is not None
+                and self._calc_df is not None
+                and len(self._calc_df) >= self._bb_window
+                and len(df) == len(self._calc_df) + 1
+                and df.index[-2] == self._calc_df.index[-1])
+
+    def _seed_indicator_state(self, calc_df):
+        """Capture the accumulators behind the last computed bar"""
+        close = np.ascontiguousarray(calc_df['Close'].to_numpy(dtype=np.float64))
+        avg_gain, avg_loss = kernels.rsi_state(close, self._rsi_period)
+        ema_fast, ema_slow, ema_sig = kernels.macd_state(
+            close, self._macd_fast, self._macd_slow, self._macd_sign)
+        self._ind_state = {
+            'prev_close': close[-1],
+            'avg_gain': avg_gain, 'avg_loss': avg_loss,
+            'ema_fast': ema_fast, 'ema_slow': ema_slow, 'ema_sig': ema_sig,
+        }
+        self._calc_df = calc_df
+
+    def _step_signals(self, df):
+        """Fold one new bar into the indicator columns in O(1)"""
+        st = self._ind_state
+        close = float(df['Close'].to_numpy()[-1])
+
+        rsi, st['avg_gain'], st['avg_loss'] = kernels.rsi_step(
+            close, st['prev_close'], st['avg_gain'], st['avg_loss'],
+            self._rsi_period)
+        st['ema_fast'] = kernels.ema_step(close, st['ema_fast'],
+                                          2.0 / (self._macd_fast + 1.0))
+        st['ema_slow'] = kernels.ema_step(close, st['ema_slow'],
+                                          2.0 / (self._macd_slow + 1.0))
+        macd = st['ema_fast'] - st['ema_slow']
+        st['ema_sig'] = kernels.ema_step(macd, st['ema_sig'],
+                                         2.0 / (self._macd_sign + 1.0))
+        # calculate_signals reseeded the ring buffer up to this bar
+        bb_high, bb_low = kernels.bb_step(
+            self._close_buf.last(self._bb_window), self._bb_window)
+        # The running sum was reseeded alongside the ring buffers, so the
+        # live average is a division rather than a window copy + re-sum
+        vol_ma = self._vol_mean.mean()
+        st['prev_close'] = close
+
+        new_row = df.iloc[[-1]].assign(
+            RSI=np.float32(rsi), MACD=np.float32(macd),
+            MACD_signal=np.float32(st['ema_sig']),
+            BB_high=np.float32(bb_high), BB_low=np.float32(bb_low),
+            Volume_MA20=np.float32(vol_ma))
+        self._calc_df = pd.concat([self._calc_df, new_row])
+        self.macd_history.append((macd, float(st['ema_sig'])))
+        return self._calc_df
+
     def calculate_signals(self, df):
-        """Calculate technical indicators and generate signals"""
-        # Adding RSI
-        df['RSI'] = ta.momentum.RSIIndicator(df['Close']).rsi()
-        
-        # Adding MACD
-        macd = ta.trend.MACD(df['Close'])
-        df['MACD'] = macd.macd()
-        df['MACD_signal'] = macd.macd_signal()
-        
-        # Adding Bollinger Bands
-        bollinger = ta.volatility.BollingerBands(df['Close'])
-        df['BB_high'] = bollinger.bollinger_hband()
-        df['BB_low'] = bollinger.bollinger_lband()
-        
-        return df
+        """Calculate technical indicators and generate signals.
+
+        After the first full pass seeds the incremental state, a df that
+        grew by exactly one bar is handled by the O(1) step path; anything
+        else (first call, intrabar revision, symbol switch) falls back to
+        the full recompute below.
+        """
+        if self._can_step(df):
+            # Only get_data reseeds the hot buffers; frames fed in
+            # directly (the manager's poll/screen paths) bypass it, so
+            # reseed here whenever the buffers don't already end on this
+            # bar — otherwise bb_step would scan a stale or empty window
+            if self._buf_ts is None or self._buf_ts != df.index[-1]:
+                self._reseed_buffers(df)
+            return self._step_signals(df)
+
+        if HAVE_NUMBA:
+            # JIT-compiled kernels: one native pass per indicator instead
+            # of rebuilding ta indicator objects every tick
+            close = np.ascontiguousarray(df['Close'].to_numpy(dtype=np.float64))
+            # Kernels compute in float64 for accuracy; store back as float32
+            rsi = kernels.rsi_kernel(close, self._rsi_period).astype(np.float32)
+            macd, macd_signal = kernels.macd_kernel(
+                close, self._macd_fast, self._macd_slow, self._macd_sign)
+            bb_high, bb_low = kernels.bb_kernel(close, self._bb_window)
+            macd = macd.astype(np.float32)
+            macd_signal = macd_signal.astype(np.float32)
+            bb_high = bb_high.astype(np.float32)
+            bb_low = bb_low.astype(np.float32)
+        else:
+            # Fallback when numba is missing: ta's functional API skips the
+            # per-tick indicator-object construction and validation the
+            # class wrappers do; results kept at the data's precision
+            close_series = df['Close']
+            rsi = ta.momentum.rsi(close_series,
+                                  window=self._rsi_period).astype('float32')
+            macd = ta.trend.macd(close_series, window_fast=self._macd_fast,
+                                 window_slow=self._macd_slow).astype('float32')
+            macd_signal = ta.trend.macd_signal(
+                close_series, window_fast=self._macd_fast,
+                window_slow=self._macd_slow,
+                window_sign=self._macd_sign).astype('float32')
+            bb_high = ta.volatility.bollinger_hband(
+                close_series, window=self._bb_window).astype('float32')
+            bb_low = ta.volatility.bollinger_lband(
+                close_series, window=self._bb_window).astype('float32')
+
+        # The volume strategy needs a 20-bar volume mean; computing the
+        # column here means it's one rolling pass per frame instead of
+        # one per strategy call
+        vol_ma = kernels.rolling_mean(df['Volume'],
+                                      self._vol_window).astype('float32')
+
+        # One assign means one BlockManager consolidation instead of six
+        # separate column insertions
+        calc_df = df.assign(RSI=rsi, MACD=macd, MACD_signal=macd_signal,
+                            BB_high=bb_high, BB_low=bb_low,
+                            Volume_MA20=vol_ma)
+        self._seed_indicator_state(calc_df)
+        # Full recompute: rebuild the chart history from the tail
+        pairs = calc_df[['MACD', 'MACD_signal']].to_numpy()[-self.macd_history.maxlen:]
+        self.macd_history.clear()
+        self.macd_history.extend(map(tuple, pairs.tolist()))
+        return calc_df
     
+    # Columns read once per tick for display/decisions
+    _LATEST_COLUMNS = ['Close', 'RSI', 'MACD', 'MACD_signal', 'BB_high', 'BB_low']
+
+    def latest_values(self, df):
+        """Extract the latest row of price/indicator values as plain floats.
+
+        One to_numpy() pass replaces six separate .iloc[-1] lookups, each
+        of which would go through pandas indexing machinery per tick.
+        """
+        row = df[self._LATEST_COLUMNS].to_numpy()[-1]
+        return dict(zip(self._LATEST_COLUMNS, row))
+
     def analyze_signals(self, df) -> list[Signal]:
-        """Analyze all strategies and return triggered signals"""
+        """Analyze strategies and return triggered signals.
+
+        Strategies are ordered cheapest-first and evaluation stops at the
+        first qualifying signal, unless require_confirmation is set, in
+        which case every strategy still runs so callers can cross-check.
+        """
         signals = []
-        
-        # Check each strategy
+
+        # Check each strategy (cheapest first: the volume strategy is the
+        # only one that needs a rolling scan)
         strategies = [
             self.strategies.rsi_strategy,
-            self.strategies.macd_cross_strategy,
             self.strategies.bollinger_bands_strategy,
+            self.strategies.macd_cross_strategy,
             self.strategies.volume_price_strategy
         ]
-        
+
         for strategy in strategies:
             signal = strategy(df)
             if signal and signal.strength >= self.min_signal_strength:
                 signals.append(signal)
-                
+                if not self.require_confirmation:
+                    break  # A qualifying signal is enough; skip the rest
+
         return signals
     
-    # def run(self):
-    #     """Main bot loop"""
-    #     print(f"Starting bot for {self.symbol}")
-    #     while True:
-    #         try:
-    #             # Get current data
-    #             df = self.get_data()
-    #             if df is None:
-    #                 print("No data available, waiting before retry...")
-    #                 time.sleep(60)
-    #                 continue
-                
-    #             # Print current price for debugging
-    #             current_price = df['Close'].iloc[-1]
-    #             print(f"Current price: ${current_price:.2f}")
-                
-    #             # Calculate technical indicators
-    #             df = self.calculate_signals(df)
-                
-    #             # Print indicator values for debugging
-    #             print(f"RSI: {df['RSI'].iloc[-1]:.2f}")
-    #             print(f"MACD: {df['MACD'].iloc[-1]:.2f}")
-    #             print(f"BB Upper: {df['BB_high'].iloc[-1]:.2f}")
-    #             print(f"BB Lower: {df['BB_low'].iloc[-1]:.2f}")
-                
-    #             # Analyze trading signals
-    #             signals = self.analyze_signals(df)
-                
-    #             for signal in signals:
-    #                 print(f"{datetime.now()}: {signal.type} signal generated at price: {signal.price:.2f} ({signal.reason})")
-    #                 self.position = not self.position  # Toggle position
-                
-    #             if not signals:
-    #                 print("No trading signal generated")
-                
-    #             # Wait before next iteration
-    #             print("Waiting 60 seconds before next check...")
-    #             time.sleep(60)  # Check every minute
-                
-    #         except Exception as e:
-    #             print(f"Error occurred: {e}")
-    #             time.sleep(60)  # Wait a minute before retrying
-
-# if __name__ == "__main__":
-#     # Create and run bot for AAPL (or any other valid symbol)
-#     bot = TradingBot("ETHT")
-#     try:
-#         bot.run()
-#     except KeyboardInterrupt:
-#         print("\nBot stopped by user")
-#     except Exception as e:
-#         print(f"\nBot stopped due to error: {e}")
+    def quick_signal(self, df):
+        """Branch-free BUY/SELL screen over the computed indicator columns.
+
+        The combined RSI/MACD/Bollinger conditions are evaluated as whole
+        boolean arrays and reduced with np.select, so there are no
+        per-row Python conditionals; returns 'BUY', 'SELL' or None for
+        the latest bar. Cheaper than analyze_signals when only a
+        yes/no screen is needed (e.g. scanning many tickers).
+        """
+        rsi = df['RSI'].to_numpy()
+        macd = df['MACD'].to_numpy()
+        macd_sig = df['MACD_signal'].to_numpy()
+        close = df['Close'].to_numpy()
+        bb_low = df['BB_low'].to_numpy()
+        bb_high = df['BB_high'].to_numpy()
+
+        buy = (rsi < 35) & (macd > macd_sig) & (close < bb_low * 1.005)
+        sell = (rsi > 65) & (macd < macd_sig) & (close > bb_high * 0.995)
+        decision = np.select([buy, sell], ['BUY', 'SELL'], default='')
+        return decision[-1] or None
+
+    async def run(self):
+        """Main bot loop as a coroutine.
+
+        yfinance calls are blocking, so they run in the default executor;
+        the 60s wait uses asyncio.sleep instead of time.sleep, so many
+        bots can share a single thread (see run_bots below).
+        """
+        log.info("Starting bot for %s", self.symbol)
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                # Get current data (blocking HTTP moved off the event loop)
+                df = await loop.run_in_executor(None, self.get_data)
+                if df is None:
+                    log.debug("No data available, waiting before retry...")
+                    await asyncio.sleep(60)
+                    continue
+
+                # Calculate technical indicators
+                df = self.calculate_signals(df)
+
+                # Analyze trading signals
+                signals = self.analyze_signals(df)
+
+                for signal in signals:
+                    log.info("%s signal generated at price: %.2f (%s)", signal.type, signal.price, signal.reason)
+                    self.position = not self.position  # Toggle position
+
+                if not signals:
+                    log.debug("No trading signal generated")
+
+                # Wait before next iteration without blocking the loop
+                await asyncio.sleep(60)
+
+            except Exception as e:
+                log.error("Error occurred: %s", e)
+                await asyncio.sleep(60)
+
+
+class TradingBotManager:
+    """
+    Watches several symbols with one batched yfinance request per tick.
+
+    yf.download accepts a list of tickers and fetches them in a single
+    round-trip, so a tick costs one network latency instead of one per
+    symbol. Each slice of the MultiIndex result is handed to that
+    symbol's TradingBot for indicators and signal analysis.
+    """
+
+    def __init__(self, symbols, interval='1m'):
+        self.interval = interval
+        self.bots = {s.upper(): TradingBot(s, interval) for s in symbols}
+
+    @property
+    def symbols(self):
+        return list(self.bots)
+
+    def add_symbol(self, symbol):
+        symbol = symbol.upper()
+        if symbol not in self.bots:
+            self.bots[symbol] = TradingBot(symbol, self.interval)
+
+    def fetch_all(self):
+        """Fetch every watched symbol in one batched download"""
+        df = yf.download(self.symbols, period='1d', interval=self.interval,
+                         group_by='ticker', threads=True, progress=False,
+                         session=_SESSION)
+        frames = {}
+        for sym in self.symbols:
+            if len(self.bots) > 1:
+                if sym not in df.columns.get_level_values(0):
+                    continue
+                sub = df[sym].dropna(how='all')
+            else:
+                sub = df.dropna(how='all')
+            if not sub.empty:
+                frames[sym] = TradingBot._trim(sub)
+        return frames
+
+    def poll_once(self):
+        """Fetch all symbols once; return {symbol: [Signal, ...]} for hits"""
+        results = {}
+        for sym, frame in self.fetch_all().items():
+            bot = self.bots[sym]
+            frame = bot.calculate_signals(frame)
+            signals = bot.analyze_signals(frame)
+            if signals:
+                results[sym] = signals
+        return results
+
+    def screen_once(self):
+        """Cheap vectorized screen; returns {symbol: 'BUY'|'SELL'} for hits"""
+        results = {}
+        for sym, frame in self.fetch_all().items():
+            bot = self.bots[sym]
+            decision = bot.quick_signal(bot.calculate_signals(frame))
+            if decision:
+                results[sym] = decision
+        return results
+
+    def screen_strategies_once(self):
+        """Per-strategy screen over all symbols in one vectorized pass.
+
+        Stacks the latest indicator values of every fetched symbol into
+        columns and runs the *_strategy_batch variants once, so adding
+        symbols adds rows to a handful of ufunc calls rather than more
+        per-symbol Python strategy invocations. Returns
+        {symbol: 'BUY'|'SELL'} with the first hit in the usual
+        rsi/macd/bollinger order deciding, mirroring analyze_signals
+        without confirmation.
+        """
+        frames = {sym: self.bots[sym].calculate_signals(frame)
+                  for sym, frame in self.fetch_all().items()}
+        syms = [s for s, f in frames.items() if len(f) >= 2]
+        if not syms:
+            return {}
+
+        cols = ('RSI', 'Close', 'MACD', 'MACD_signal', 'BB_high', 'BB_low')
+        last = np.array([[frames[s][c].values[-1] for c in cols]
+                         for s in syms])
+        macd_prev = np.array([frames[s]['MACD'].values[-2] for s in syms])
+        sig_prev = np.array([frames[s]['MACD_signal'].values[-2] for s in syms])
+
+        rsi_k, _, _ = TradingStrategies.rsi_strategy_batch(last[:, 0], last[:, 1])
+        macd_k, _, _ = TradingStrategies.macd_cross_strategy_batch(
+            last[:, 2], last[:, 3], macd_prev, sig_prev, last[:, 1])
+        bb_k, _, _ = TradingStrategies.bollinger_bands_strategy_batch(
+            last[:, 1], last[:, 4], last[:, 5])
+
+        kinds = np.where(rsi_k != KIND_NONE, rsi_k,
+                         np.where(macd_k != KIND_NONE, macd_k, bb_k))
+        return {s: ('BUY' if k == KIND_BUY else 'SELL')
+                for s, k in zip(syms, kinds) if k != KIND_NONE}
+
+
+def run_bots(bots):
+    """Run several TradingBot loops concurrently on one event loop"""
+    async def _gather():
+        await asyncio.gather(*[bot.run() for bot in bots])
+    asyncio.run(_gather())
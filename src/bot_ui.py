@@ -1,14 +1,58 @@
 # app UI
+import io
+import logging
+import queue
+import re
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
+from collections import deque
+from functools import lru_cache
 from datetime import datetime, timedelta
 import time
-from src import TradingBot  # Add this line
 import winsound  # For Windows alert sound (use different library for other OS)
-from src.utils.strategies import Signal  # Add this import
-from src.utils.trend_predictor import TrendPredictor  # Add this import
-from tkcalendar import DateEntry
+from src.utils.async_client import AsyncDataClient
+from src.utils.cache import INTERVAL_SECONDS
+
+# TradingBot, TrendPredictor and tkcalendar are imported lazily where
+# they are first needed: together they pull in pandas, numpy and
+# yfinance, which would otherwise run before Tk draws the first frame
+
+# Plausible ticker shape; anything else fails before touching the network
+_SYMBOL_RE = re.compile(r'^[A-Z][A-Z0-9.\-]{0,9}$')
+
+
+@lru_cache(maxsize=256)
+def _validate_symbol_cached(symbol, today_iso):
+    """Check a symbol against yfinance; memoized per symbol per UTC day.
+
+    Returns (is_valid, reason). Non-empty 5d history is proof enough on
+    its own, so the expensive ticker.info fetch (a large JSON blob,
+    often 0.5-2s) is skipped entirely. The date key makes stale entries
+    expire naturally at the day boundary.
+
+    Network errors raise through on purpose: lru_cache does not cache
+    exceptions, so a transient failure stays retryable instead of
+    pinning the symbol invalid for the day. validate_symbol catches.
+    """
+    import yfinance as yf
+    hist = yf.Ticker(symbol).history(period="5d")
+    if hist.empty:
+        return False, f"No historical data found for {symbol}"
+    return True, None
+
+
+class UILogHandler(logging.Handler):
+    """Forwards log records from the bot modules into the UI log box"""
+    def __init__(self, ui):
+        super().__init__(level=logging.INFO)
+        self.ui = ui
+
+    def emit(self, record):
+        try:
+            self.ui.log(self.format(record))
+        except Exception:
+            pass  # Never let a logging failure break the bot loop
+
 
 class TradingBotUI:
     def __init__(self, root):
@@ -17,8 +61,48 @@ class TradingBotUI:
         self.root.geometry("800x600")
         self.bot = None
         self.is_running = False
-        
+        # Snapshots from the worker queue up here; a Tk timer drains at a
+        # fixed cadence so a slow repaint can never back up the bot loop
+        self._ui_queue = queue.SimpleQueue()
+        # All blocking yfinance work goes through this client so the Tk
+        # thread never waits on the network unbounded
+        self.data_client = AsyncDataClient()
+        # Worker process pool for backtests, created on first use
+        self._backtest_pool = None
+        # Log lines queue up here; the drain timer flushes them in one
+        # Text insert instead of one Tcl call per line
+        self._log_buffer = deque(maxlen=1000)
+        # Formatted timestamp cache, reused within the same second
+        self._log_ts_cache = 0
+        self._log_ts_str = ''
+        # Last chart repaint time, for coalescing back-to-back updates
+        self._last_chart_draw = 0.0
+        # Last alert time per signal type, for modal dedupe
+        self._recent_alerts = {}
+        # Last text applied per StringVar, for diff-before-set
+        self._last_vars = {}
+        # Pending after() id for the debounced symbol format check
+        self._symbol_check_after = None
+        # Tick counter driving the chart redraw cadence
+        self._tick = 0
+        # Trend prediction memo: same bar + same close means the same
+        # answer, so don't rerun the predictor on no-op ticks
+        self._last_trend_key = None
+        self._last_trend = None
+
         self.setup_ui()
+
+        # Warm the validation cache for the default symbol so the first
+        # Run Backtest click doesn't wait on a network round-trip
+        self.data_client.submit(_validate_symbol_cached, self.symbol_var.get(),
+                                datetime.utcnow().date().isoformat())
+
+        # The drain timer runs for the life of the window: it applies the
+        # newest snapshot and flushes buffered log lines each pass
+        self.root.after(self.UI_DRAIN_MS, self._drain_ui_queue)
+
+        # Signal events (INFO+) from the bot modules show up in the log box
+        logging.getLogger('src').addHandler(UILogHandler(self))
         
     def setup_ui(self):
         # Top Frame for Controls
@@ -30,6 +114,9 @@ class TradingBotUI:
         self.symbol_var = tk.StringVar(value="AAPL")
         self.symbol_entry = ttk.Entry(control_frame, textvariable=self.symbol_var, width=10)
         self.symbol_entry.pack(side=tk.LEFT, padx=5)
+        # Color the entry red on malformed input, debounced so the check
+        # runs once after the user pauses rather than on every keystroke
+        self.symbol_entry.bind('<KeyRelease>', self._on_symbol_typed)
         
         # Add Switch Stock Button
         self.switch_button = ttk.Button(control_frame, text="Switch Stock", command=self.switch_stock)
@@ -64,6 +151,11 @@ class TradingBotUI:
         ttk.Label(data_frame, textvariable=self.bb_upper_var).pack(anchor='w')
         ttk.Label(data_frame, textvariable=self.bb_lower_var).pack(anchor='w')
         
+        # MACD Chart (built lazily on the first data tick, see _ensure_chart)
+        self.chart_frame = ttk.LabelFrame(self.root, text="MACD Chart", padding="10")
+        self.chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.canvas = None
+
         # Log Display
         log_frame = ttk.LabelFrame(self.root, text="Log", padding="10")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -81,11 +173,20 @@ class TradingBotUI:
         signal_strength_entry = ttk.Entry(strategy_frame, textvariable=self.signal_strength_var, width=5)
         signal_strength_entry.pack(side=tk.LEFT, padx=5)
         
+        # Chart redraw cadence: labels update every tick, the heavier
+        # matplotlib repaint only every N-th
+        ttk.Label(strategy_frame, text="Chart Every N Ticks:").pack(side=tk.LEFT, padx=(10, 0))
+        self.chart_update_every_var = tk.IntVar(value=5)
+        chart_every_spin = ttk.Spinbox(strategy_frame, from_=1, to=60, width=4,
+                                       textvariable=self.chart_update_every_var)
+        chart_every_spin.pack(side=tk.LEFT, padx=5)
+        
         # Add Backtest Frame
         backtest_frame = ttk.LabelFrame(self.root, text="Backtesting", padding="10")
         backtest_frame.pack(fill=tk.X, padx=10, pady=5)
         
         # Start Date
+        from tkcalendar import DateEntry
         ttk.Label(backtest_frame, text="Start Date:").pack(side=tk.LEFT)
         self.start_date_picker = DateEntry(backtest_frame, 
                                          width=12,
@@ -130,11 +231,50 @@ class TradingBotUI:
             return today - timedelta(days=1)
         return today
 
+    # Oldest log lines are dropped past this, so Text inserts stay O(1)
+    # instead of degrading over an all-day session
+    MAX_LOG_LINES = 1000
+
     def log(self, message):
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.insert(tk.END, f"[{current_time}] {message}\n")
+        """Queue a log line; safe from any thread, flushed by the UI timer"""
+        # strftime is surprisingly costly for something called on every
+        # event; lines landing in the same second reuse one formatted string
+        now = int(time.time())
+        if now != self._log_ts_cache:
+            self._log_ts_cache = now
+            self._log_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        self._log_buffer.append(f"[{self._log_ts_str}] {message}\n")
+
+    def _flush_log(self):
+        """Insert all buffered log lines with a single Text operation"""
+        if not self._log_buffer:
+            return
+        lines = []
+        while self._log_buffer:
+            lines.append(self._log_buffer.popleft())
+        self.log_text.insert(tk.END, ''.join(lines))
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            # Trim from the top back down to the cap
+            self.log_text.delete('1.0', f'{line_count - self.MAX_LOG_LINES + 1}.0')
         self.log_text.see(tk.END)
         
+    # Wait this long after the last keystroke before re-checking (ms)
+    SYMBOL_DEBOUNCE_MS = 300
+
+    def _on_symbol_typed(self, event=None):
+        """Debounce keystrokes into one deferred format check"""
+        if self._symbol_check_after is not None:
+            self.root.after_cancel(self._symbol_check_after)
+        self._symbol_check_after = self.root.after(self.SYMBOL_DEBOUNCE_MS,
+                                                   self._check_symbol_format)
+
+    def _check_symbol_format(self):
+        """Purely local feedback against _SYMBOL_RE; no network involved"""
+        self._symbol_check_after = None
+        valid = bool(_SYMBOL_RE.match(self.symbol_var.get().upper()))
+        self.symbol_entry.config(foreground='black' if valid else 'red')
+
     def toggle_bot(self):
         if not self.is_running:
             self.start_bot()
@@ -142,15 +282,20 @@ class TradingBotUI:
             self.stop_bot()
             
     def start_bot(self):
+        from src import TradingBot
+
         self.is_running = True
         self.start_button.config(text="Stop")
         self.switch_button.config(state='normal')  # Enable switch button when bot starts
         self.log("Bot started")
         
-        # Start bot in separate thread
-        self.bot_thread = threading.Thread(target=self.run_bot)
-        self.bot_thread.daemon = True
-        self.bot_thread.start()
+        self.bot = TradingBot(self.symbol_var.get(), self.interval_var.get())
+        # Poll at the bar cadence: re-fetching a 1h bar every 60s just
+        # downloads the same intrabar data over and over
+        self._poll_seconds = INTERVAL_SECONDS.get(self.interval_var.get(), 60)
+        self._next_deadline = time.monotonic()
+        self._last_bar_ts = None
+        self._schedule_tick()
         
     def stop_bot(self):
         self.is_running = False
@@ -158,62 +303,222 @@ class TradingBotUI:
         self.switch_button.config(state='disabled')  # Disable switch button when bot stops
         self.log("Bot stopped")
         
-    def run_bot(self):
-        self.bot = TradingBot(self.symbol_var.get(), self.interval_var.get())
-        
-        while self.is_running:
-            try:
-                df = self.bot.get_data()
-                if df is None:
-                    self.log("No data available, waiting before retry...")
-                    time.sleep(60)
-                    continue
-                
-                # Calculate indicators
-                df = self.bot.calculate_signals(df)
-                
-                # Update regular displays
-                current_price = df['Close'].iloc[-1]
-                self.price_var.set(f"Current Price: ${current_price:.2f}")
-                self.rsi_var.set(f"RSI: {df['RSI'].iloc[-1]:.2f}")
-                self.macd_var.set(f"MACD: {df['MACD'].iloc[-1]:.2f}")
-                self.bb_upper_var.set(f"BB Upper: {df['BB_high'].iloc[-1]:.2f}")
-                self.bb_lower_var.set(f"BB Lower: {df['BB_low'].iloc[-1]:.2f}")
-                
-                # Get and display trend prediction
-                direction, strength, reason = TrendPredictor.predict_trend(df)
-                
-                # Update prediction displays with colors
-                self.trend_direction_var.set(f"Direction: {direction}")
-                self.trend_strength_var.set(f"Strength: {strength:.2f}")
-                self.trend_reason_var.set(f"Reason: {reason}")
-                
-                # Color-code the direction based on prediction
-                color = {
-                    "UP": "green",
-                    "DOWN": "red",
-                    "SIDEWAYS": "gray"
-                }.get(direction, "black")
-                
-                # Log significant trend changes
-                self.log(f"Trend Update: {direction} (Strength: {strength:.2f}) - {reason}")
-                
-                # Check for signals
-                signals = self.bot.analyze_signals(df)
-                for signal in signals:
-                    self.show_alert(signal)
-                
-                time.sleep(60)
-                
-            except Exception as e:
-                self.log(f"Error occurred: {e}")
-                time.sleep(60)
+    def _schedule_tick(self):
+        """Kick off one fetch/process cycle on the data client.
+
+        The whole loop lives in Tk's event system now: no dedicated
+        thread spinning in time.sleep, and Stop takes effect at the next
+        callback instead of up to a bar later.
+        """
+        if not self.is_running:
+            return  # Stop clicked: simply don't reschedule
+        future = self.data_client.submit(self._tick_worker)
+        self.root.after(100, self._poll_tick, future)
+
+    def _tick_worker(self):
+        """Fetch and process one tick (runs on the data client's executor)"""
+        df = self.bot.get_data()
+        if df is None:
+            self.log("No data available, waiting before retry...")
+            return None
+        if self._last_bar_ts is not None and df.index[-1] == self._last_bar_ts:
+            # Same bar as last tick: nothing new to compute or show
+            return None
+        self._last_bar_ts = df.index[-1]
+        return self._process_tick(df)
+
+    def _poll_tick(self, future):
+        """Collect a finished tick and line up the next one"""
+        if not future.done():
+            self.root.after(100, self._poll_tick, future)
+            return
+        try:
+            snapshot = future.result()
+            if snapshot is not None:
+                self._ui_queue.put(snapshot)
+        except Exception as e:
+            self.log(f"Error occurred: {e}")
+
+        # Advance a monotonic deadline so slow fetches don't make the
+        # schedule drift: a 3s fetch shortens the next wait by 3s
+        self._next_deadline += self._poll_seconds
+        delay_ms = max(0, int((self._next_deadline - time.monotonic()) * 1000))
+        if self.is_running:
+            self.root.after(delay_ms, self._schedule_tick)
+
+    def _process_tick(self, df):
+        """Run indicators, trend prediction and signal checks on a frame.
+
+        Shared by the polling loop and switch_stock so optimizations to
+        the pipeline apply to both. Returns the snapshot dict of display
+        strings; signal alerts fire as a side effect.
+        """
+        from src.utils.trend_predictor import TrendPredictor
+
+        df = self.bot.calculate_signals(df)
+
+        # Build all display strings here (one last-row extraction)
+        latest = self.bot.latest_values(df)
+        trend_key = (df.index[-1].value, latest['Close'])
+        if trend_key == self._last_trend_key:
+            direction, strength, reason = self._last_trend
+        else:
+            direction, strength, reason = TrendPredictor.predict_trend(df)
+            self._last_trend_key = trend_key
+            self._last_trend = (direction, strength, reason)
+
+        snapshot = {
+            'price_var': f"Current Price: ${latest['Close']:.2f}",
+            'rsi_var': f"RSI: {latest['RSI']:.2f}",
+            'macd_var': f"MACD: {latest['MACD']:.2f}",
+            'bb_upper_var': f"BB Upper: {latest['BB_high']:.2f}",
+            'bb_lower_var': f"BB Lower: {latest['BB_low']:.2f}",
+            'trend_direction_var': f"Direction: {direction}",
+            'trend_strength_var': f"Strength: {strength:.2f}",
+            'trend_reason_var': f"Reason: {reason}",
+        }
+
+        # The chart is by far the most expensive part of a repaint, so it
+        # only rides along every N-th tick (tunable in Strategy Settings)
+        self._tick += 1
+        try:
+            chart_every = max(1, int(self.chart_update_every_var.get()))
+        except tk.TclError:
+            chart_every = 1  # Blank/garbage spinbox: just update every tick
+        if self._tick % chart_every == 0:
+            snapshot['_chart_data'] = self._prepare_chart_data(df)
+
+        # Log significant trend changes
+        self.log(f"Trend Update: {direction} (Strength: {strength:.2f}) - {reason}")
+
+        # Check for signals
+        signals = self.bot.analyze_signals(df)
+        for signal in signals:
+            self.show_alert(signal)
+
+        return snapshot
+
+    # How often the UI thread pulls queued snapshots (ms)
+    UI_DRAIN_MS = 250
+
+    def _drain_ui_queue(self):
+        """Apply at most one (the newest) queued snapshot per repaint pass"""
+        snapshot = None
+        try:
+            while True:  # Drain everything, keep only the latest
+                snapshot = self._ui_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if snapshot is not None:
+            self._apply_snapshot(snapshot)
+        self._flush_log()
+        self.root.after(self.UI_DRAIN_MS, self._drain_ui_queue)
+
+    def _apply_snapshot(self, snapshot):
+        """Apply a batch of formatted display strings on the UI thread"""
+        chart_data = snapshot.pop('_chart_data', None)
+        for var_name, text in snapshot.items():
+            # Each set() crosses into Tcl, fires traces and redraws the
+            # label, so skip vars whose text hasn't actually changed
+            if self._last_vars.get(var_name) != text:
+                getattr(self, var_name).set(text)
+                self._last_vars[var_name] = text
+        if chart_data is not None:
+            self.update_macd_chart(chart_data)
+
+    # Chart repaints closer together than this coalesce into one (seconds)
+    CHART_MIN_REDRAW_S = 0.5
+    # How many bars the chart shows
+    CHART_BARS = 30
+
+    def _ensure_chart(self):
+        """Build the matplotlib figure on first use.
+
+        Importing matplotlib costs a few hundred ms, so it stays out of
+        the startup path: the window draws first and the chart machinery
+        loads when the first tick actually needs it.
+        """
+        if self.canvas is not None:
+            return
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(8, 2.2), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.tick_params(labelsize=7)
+        # Persistent line artists: each update mutates these in place with
+        # set_data instead of clearing and rebuilding the whole axes
+        self._macd_line, = self.ax.plot([], [], color='blue', linewidth=1, label='MACD')
+        self._sig_line, = self.ax.plot([], [], color='orange', linewidth=1, label='Signal')
+        # The histogram BarContainer is likewise created once; updates
+        # only mutate each rectangle's height and color
+        self._hist_bars = self.ax.bar(np.arange(self.CHART_BARS),
+                                      np.zeros(self.CHART_BARS),
+                                      width=0.8, alpha=0.4)
+        self.ax.legend(loc='upper left', fontsize=7)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.chart_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _prepare_chart_data(self, df):
+        """Extract and classify the chart arrays on the worker thread.
+
+        Slices plain numpy views instead of df.tail(30), which allocates
+        a whole new DataFrame just to look at the last 30 rows. Doing
+        this off-thread leaves the Tk side nothing but artist mutation
+        and a scheduled repaint.
+        """
+        import numpy as np
+
+        if self.bot.macd_history:
+            # The bot's step path maintains exactly the 30 pairs the
+            # chart needs, so no column conversion happens at all
+            pairs = np.asarray(self.bot.macd_history, dtype=np.float64)
+            macd, sig = pairs[:, 0], pairs[:, 1]
+        else:
+            macd = df['MACD'].to_numpy(copy=False)[-self.CHART_BARS:]
+            sig = df['MACD_signal'].to_numpy(copy=False)[-self.CHART_BARS:]
+        hist = macd - sig
+        return macd, sig, hist, np.where(hist >= 0, 'green', 'red')
+
+    def update_macd_chart(self, chart_data):
+        """Refresh the MACD chart by updating its persistent artists"""
+        self._ensure_chart()
+        now = time.monotonic()
+        if now - self._last_chart_draw < self.CHART_MIN_REDRAW_S:
+            return  # A repaint just happened; this update can wait
+        self._last_chart_draw = now
+
+        import numpy as np
+
+        macd, sig, hist, colors = chart_data
+        x = np.arange(macd.shape[0])
+
+        self._macd_line.set_data(x, macd)
+        self._sig_line.set_data(x, sig)
+
+        # Mutate the persistent rectangles in place; no artist is ever
+        # created or destroyed after _ensure_chart
+        for patch, h, c in zip(self._hist_bars.patches, hist, colors):
+            patch.set_height(h)
+            patch.set_color(c)
+        for patch in self._hist_bars.patches[hist.shape[0]:]:
+            patch.set_height(0)  # Early session: fewer bars than slots
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        # draw_idle schedules one repaint in Tk's idle loop instead of
+        # blocking here on a full draw()
+        self.canvas.draw_idle()
 
     def switch_stock(self):
         """Switch to a new stock symbol"""
+        from src import TradingBot
+
         new_symbol = self.symbol_var.get().upper()
         if new_symbol != self.bot.symbol:
             self.log(f"Switching from {self.bot.symbol} to {new_symbol}")
+            self._last_trend_key = None  # Old symbol's trend memo is stale
             
             # Create a new bot instance (same as starting)
             self.bot = TradingBot(new_symbol, self.interval_var.get())
@@ -222,87 +527,94 @@ class TradingBotUI:
                 # Get and process data
                 df = self.bot.get_data()
                 if df is not None:
-                    df = self.bot.calculate_signals(df)
-                    
-                    # Update all displays
-                    current_price = df['Close'].iloc[-1]
-                    self.price_var.set(f"Current Price: ${current_price:.2f}")
-                    self.rsi_var.set(f"RSI: {df['RSI'].iloc[-1]:.2f}")
-                    self.macd_var.set(f"MACD: {df['MACD'].iloc[-1]:.2f}")
-                    self.bb_upper_var.set(f"BB Upper: {df['BB_high'].iloc[-1]:.2f}")
-                    self.bb_lower_var.set(f"BB Lower: {df['BB_low'].iloc[-1]:.2f}")
-                    
-                    # Get trend prediction
-                    direction, strength, reason = TrendPredictor.predict_trend(df)
-                    self.trend_direction_var.set(f"Direction: {direction}")
-                    self.trend_strength_var.set(f"Strength: {strength:.2f}")
-                    self.trend_reason_var.set(f"Reason: {reason}")
-                    
-                    # Check for signals
-                    signals = self.bot.analyze_signals(df)
-                    for signal in signals:
-                        self.show_alert(signal)
-                        
+                    # Same pipeline as the polling loop; switch_stock runs
+                    # on the Tk thread, so apply the snapshot directly
+                    snapshot = self._process_tick(df)
+                    self._apply_snapshot(snapshot)
+
                     self.log(f"Successfully switched to {new_symbol}")
-                    
-                    # Log significant trend changes
-                    self.log(f"Trend Update: {direction} (Strength: {strength:.2f}) - {reason}")
                 else:
                     self.log(f"Error: Could not fetch data for {new_symbol}")
             except Exception as e:
                 self.log(f"Error switching to {new_symbol}: {e}")
 
-    def show_alert(self, signal: Signal):
-        """Show alert for trading signal"""
-        message = f"""
-        {signal.type} Signal Detected!
-        Price: ${signal.price:.2f}
-        Reason: {signal.reason}
-        Strength: {signal.strength:.2f}
-        """
+    # Repeat alerts of the same type inside this window collapse (seconds)
+    ALERT_DEDUPE_S = 5.0
+
+    def show_alert(self, signal):
+        """Queue an alert for the Tk thread; safe to call from the bot loop"""
+        now = time.monotonic()
+        last = self._recent_alerts.get(signal.type)
+        if last is not None and now - last < self.ALERT_DEDUPE_S:
+            return  # A noisy indicator shouldn't stack up modal boxes
+        self._recent_alerts[signal.type] = now
+
+        # Log signal
+        self.log(f"Signal: {signal.type} - {signal.reason} (Strength: {signal.strength:.2f})")
+
+        # The messagebox blocks until dismissed; hand it to the Tk thread
+        # so the worker returns to polling immediately
+        self.root.after(0, self._show_alert_ui, signal)
+
+    # How long a signal toast stays on screen (ms)
+    TOAST_MS = 4000
+
+    def _show_alert_ui(self, signal):
+        """Show a self-dismissing toast for a signal (runs on the Tk thread)"""
+        message = (f"{signal.type} Signal Detected!\n"
+                   f"Price: ${signal.price:.2f}\n"
+                   f"Reason: {signal.reason}\n"
+                   f"Strength: {signal.strength:.2f}")
         
-        # Play alert sound
-        winsound.PlaySound("SystemExclamation", winsound.SND_ASYNC)
+        # Play alert sound; NOWAIT/NODEFAULT so a busy audio device never
+        # stalls the call or substitutes the default chime
+        winsound.PlaySound("SystemExclamation",
+                           winsound.SND_ASYNC | winsound.SND_NOWAIT | winsound.SND_NODEFAULT)
         
-        # Show popup
-        messagebox.showinfo("Trading Signal", message)
+        # A modal messagebox would halt the whole event loop (drain timer,
+        # chart repaints, tick scheduling) until dismissed; a borderless
+        # toast that destroys itself keeps everything running
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.attributes('-topmost', True)
+        tk.Label(toast, text=message, justify=tk.LEFT,
+                 background='#ffffe0', relief=tk.SOLID, borderwidth=1,
+                 padx=10, pady=8).pack()
         
-        # Log signal
-        self.log(f"Signal: {signal.type} - {signal.reason} (Strength: {signal.strength:.2f})")
+        # Pin it to the bottom-right corner of the main window
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 20
+        toast.geometry(f'+{x}+{y}')
+        toast.after(self.TOAST_MS, toast.destroy)
 
     def validate_symbol(self, symbol):
-        """Validate if the symbol exists with more detailed checking"""
-        import yfinance as yf
+        """Validate a symbol without hanging the UI thread.
+
+        Obvious junk fails the regex locally; real lookups run on the
+        async data client with a bounded wait and are cached per day.
+        """
+        # Normalize case first: the regex only matches uppercase, and a
+        # single casing keeps the lru_cache to one entry per symbol
+        symbol = symbol.upper()
+        if not _SYMBOL_RE.match(symbol):
+            self.log(f"Invalid symbol format: {symbol}")
+            return False
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # Get historical data
-            hist = ticker.history(period="5d")
-            if hist.empty:
-                self.log(f"No historical data found for {symbol}")
-                return False
-                
-            # Check if it's a valid ticker by ensuring basic info exists
-            info = ticker.info
-            if not info:
-                self.log(f"No information available for {symbol}")
-                return False
-                
-            # Additional checks if needed
-            if 'regularMarketPrice' not in info and 'previousClose' not in info:
-                self.log(f"No price information available for {symbol}")
-                return False
-                
-            return True
-            
+            valid, reason = self.data_client.call(
+                _validate_symbol_cached, symbol,
+                datetime.utcnow().date().isoformat(), timeout=10)
+            if reason:
+                self.log(reason)
+            return valid
         except Exception as e:
             self.log(f"Symbol validation error: {e}")
             return False
     
     def run_backtest(self):
-        """Run backtest with current settings"""
+        """Validate inputs and hand the backtest to a worker process"""
         try:
-            from .utils.backtester import Backtester
+            from .utils.backtester import run_backtest_worker
             
             symbol = self.symbol_var.get()
                         
@@ -323,40 +635,17 @@ class TradingBotUI:
                 return
         
             self.log(f"Starting backtest for {symbol} from {start_date}")
-            
-            backtester = Backtester(symbol, start_date, initial_capital=backtest_capital)
-            results = backtester.run_backtest()
-            
-            if results:
-                # Show results in a new window
-                results_window = tk.Toplevel(self.root)
-                results_window.title("Backtest Results")
-                results_window.geometry("600x400")
-                
-                # Results text
-                results_text = scrolledtext.ScrolledText(results_window, height=20)
-                results_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                
-                # Format results
-                results_text.insert(tk.END, f"Backtest Results for {symbol}\n")
-                results_text.insert(tk.END, f"Period: {start_date} to {datetime.now().date()}\n\n")
-                results_text.insert(tk.END, f"Total Trades: {results['total_trades']}\n")
-                results_text.insert(tk.END, f"Profitable Trades: {results['profitable_trades']}\n")
-                results_text.insert(tk.END, f"Total Return: ${results['total_return']:.2f}\n")
-                results_text.insert(tk.END, f"Return %: {results['return_pct']:.2f}%\n\n")
-                
-                results_text.insert(tk.END, "Trade History:\n")
-                for trade in results['trades']:
-                    results_text.insert(tk.END, 
-                        f"{trade['date']}: {trade['type']} {trade['shares']} shares @ ${trade['price']:.2f}\n"
-                        f"    Reason: {trade['reason']}\n"
-                        f"    Capital: ${trade['capital']:.2f}\n\n"
-                    )
-                
-                results_text.config(state='disabled')
-                
-            else:
-                messagebox.showerror("Error", "No backtest results available")
+
+            # The backtest is CPU-bound pandas work, so a thread wouldn't
+            # help under the GIL: run it in a separate process and poll
+            # the future from the Tk event loop instead of blocking here
+            if self._backtest_pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self._backtest_pool = ProcessPoolExecutor(max_workers=1)
+            self.backtest_button.config(state='disabled')
+            future = self._backtest_pool.submit(run_backtest_worker, symbol,
+                                                start_date, backtest_capital)
+            self.root.after(100, self._poll_backtest, future, symbol, start_date)
         
         except ValueError as v:
             messagebox.showerror("Invalid Input", f"Please enter a valid integer for initial capital.\n{str(v)}")
@@ -365,6 +654,64 @@ class TradingBotUI:
         except Exception as e:
             messagebox.showerror("Error", f"Backtest failed: {str(e)}")
             self.log(f"Backtest error: {e}")
+
+    def _poll_backtest(self, future, symbol, start_date):
+        """Check the backtest future without blocking the UI"""
+        if not future.done():
+            self.root.after(100, self._poll_backtest, future, symbol, start_date)
+            return
+        self.backtest_button.config(state='normal')
+        try:
+            results = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Backtest failed: {str(e)}")
+            self.log(f"Backtest error: {e}")
+            return
+        if results:
+            self._show_backtest_results(symbol, start_date, results)
+        else:
+            messagebox.showerror("Error", "No backtest results available")
+
+    # The Text widget lays out everything it holds; past this many trades
+    # the report is summarized rather than rendered in full
+    MAX_TRADES_SHOWN = 500
+
+    def _show_backtest_results(self, symbol, start_date, results):
+        """Display finished backtest results in a new window"""
+        results_window = tk.Toplevel(self.root)
+        results_window.title("Backtest Results")
+        results_window.geometry("600x400")
+        
+        # Results text
+        results_text = scrolledtext.ScrolledText(results_window, height=20)
+        results_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Stream the report into one buffer, then insert once: per-trade
+        # insert() calls are each a Tcl round-trip and crawl on backtests
+        # with thousands of trades
+        trades = results['trades']
+        buf = io.StringIO()
+        buf.write(
+            f"Backtest Results for {symbol}\n"
+            f"Period: {start_date} to {datetime.now().date()}\n\n"
+            f"Total Trades: {results['total_trades']}\n"
+            f"Profitable Trades: {results['profitable_trades']}\n"
+            f"Total Return: ${results['total_return']:.2f}\n"
+            f"Return %: {results['return_pct']:.2f}%\n\n"
+            "Trade History:\n"
+        )
+        # writelines consumes the generator without materializing a list
+        buf.writelines(
+            f"{trade['date']}: {trade['type']} {trade['shares']} shares @ ${trade['price']:.2f}\n"
+            f"    Reason: {trade['reason']}\n"
+            f"    Capital: ${trade['capital']:.2f}\n\n"
+            for trade in trades[:self.MAX_TRADES_SHOWN]
+        )
+        if len(trades) > self.MAX_TRADES_SHOWN:
+            buf.write(f"... {len(trades) - self.MAX_TRADES_SHOWN} further trades omitted\n")
+        results_text.insert(tk.END, buf.getvalue())
+        
+        results_text.config(state='disabled')
         
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""
+Compiled backtest state machine.
+
+The grid-search kernel in backtester.py is a rough screening objective;
+this module holds the full-fidelity version: the exact BUY/SELL state
+machine run_backtest used to run in Python, specialized for precomputed
+float64 indicator arrays. Thresholds and the 95% position-size fraction
+are baked in as compile-time constants, and trades are written into a
+preallocated array so the hot loop never allocates.
+
+Swing signals need Python (they walk DataFrame prefixes), so callers
+pre-evaluate them and pass the results as (bar index, kind) event
+arrays; the kernel merges them into each bar after the scalar checks,
+preserving the strategy ordering. Reason strings can't exist inside a
+kernel, so each trade carries a reason code translated back by the
+caller when the trade log is materialized.
+"""
+
+import numpy as np
+
+from ._njit import njit
+
+# Reason codes carried in the trade rows
+REASON_RSI_BUY = 0
+REASON_RSI_SELL = 1
+REASON_MACD_BUY = 2
+REASON_MACD_SELL = 3
+REASON_BB_BUY = 4
+REASON_BB_SELL = 5
+# Swing reasons are indexed into the caller's pre-built list from here
+SWING_REASON_BASE = 100
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def backtest_kernel(close, rsi, macd, macd_sig, bb_high, bb_low,
+                    swing_idx, swing_kind, initial_capital):
+    """Run the BUY/SELL state machine over the whole history.
+
+    Trade rows have columns (bar, kind, price, shares, flow,
+    capital_after, reason_code) with kind 0=BUY 1=SELL and flow holding
+    cost for buys / revenue for sells, mirroring the columnar trade
+    log. Returns (trades, trade_count, cash, position).
+    """
+    n = close.shape[0]
+    # Worst case is every candidate signal trading on every bar
+    trades = np.empty((8 * n + 8, 7))
+    t = 0
+    capital = initial_capital
+    position = 0
+    p = 0  # Next pending swing event
+
+    # Per-bar signal scratch, in strategy order
+    kinds = np.empty(8, np.int64)
+    codes = np.empty(8, np.int64)
+
+    for i in range(19, n):
+        price = close[i]
+        m = 0
+
+        # RSI strategy
+        if rsi[i] < 35.0:
+            kinds[m] = 0
+            codes[m] = REASON_RSI_BUY
+            m += 1
+        elif rsi[i] > 65.0:
+            kinds[m] = 1
+            codes[m] = REASON_RSI_SELL
+            m += 1
+
+        # MACD crossover strategy
+        if macd[i - 1] <= macd_sig[i - 1] and macd[i] > macd_sig[i]:
+            kinds[m] = 0
+            codes[m] = REASON_MACD_BUY
+            m += 1
+        elif macd[i - 1] >= macd_sig[i - 1] and macd[i] < macd_sig[i]:
+            kinds[m] = 1
+            codes[m] = REASON_MACD_SELL
+            m += 1
+
+        # Bollinger band touches (0.5% margin)
+        if price < bb_low[i] * 1.005:
+            kinds[m] = 0
+            codes[m] = REASON_BB_BUY
+            m += 1
+        elif price > bb_high[i] * 0.995:
+            kinds[m] = 1
+            codes[m] = REASON_BB_SELL
+            m += 1
+
+        # Pre-evaluated swing signals for this bar, after the scalar ones
+        while p < swing_idx.shape[0] and swing_idx[p] == i:
+            kinds[m] = swing_kind[p]
+            codes[m] = SWING_REASON_BASE + p
+            m += 1
+            p += 1
+
+        for s in range(m):
+            if kinds[s] == 0 and position == 0:
+                # Invest 95% of capital, like the Python state machine
+                shares = int((capital * 0.95) / price)
+                cost = shares * price
+                capital -= cost
+                position = shares
+                trades[t, 0] = i
+                trades[t, 1] = 0.0
+                trades[t, 2] = price
+                trades[t, 3] = shares
+                trades[t, 4] = cost
+                trades[t, 5] = capital
+                trades[t, 6] = codes[s]
+                t += 1
+            elif kinds[s] == 1 and position > 0:
+                revenue = position * price
+                capital += revenue
+                trades[t, 0] = i
+                trades[t, 1] = 1.0
+                trades[t, 2] = price
+                trades[t, 3] = position
+                trades[t, 4] = revenue
+                trades[t, 5] = capital
+                trades[t, 6] = codes[s]
+                position = 0
+                t += 1
+
+    return trades[:t], t, capital, position
@@ -0,0 +1,24 @@
+"""
+Optional numba support.
+
+numba is not a hard dependency: when it is installed the indicator
+kernels are JIT-compiled, otherwise the decorator below is a no-op and
+the kernels run as plain Python (callers can check HAVE_NUMBA to pick
+a pandas/ta fallback instead).
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable"""
+        # Support both @njit and @njit(cache=True, ...) usage
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+
+class AsyncDataClient:
+    """
+    Runs blocking data work (yfinance calls) off the Tk thread.
+
+    One asyncio event loop lives on a single background thread for the
+    whole app; blocking callables are wrapped with run_in_executor and
+    submitted via run_coroutine_threadsafe. UI handlers can either wait
+    with a short timeout (validate) or poll the returned future, so the
+    window never freezes on a slow network round-trip.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _call(self, func, args):
+        return await self._loop.run_in_executor(None, lambda: func(*args))
+
+    def submit(self, func, *args):
+        """Schedule a blocking callable; returns a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(self._call(func, args),
+                                                self._loop)
+
+    def call(self, func, *args, timeout=None):
+        """Schedule a blocking callable and wait (bounded) for its result"""
+        return self.submit(func, *args).result(timeout)
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -1,8 +1,24 @@
+import logging
+import os
 from datetime import datetime, timedelta
+from functools import partial
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
 import yfinance as yf
 import ta
-from .strategies import Signal, TradingStrategies
+from ._njit import njit, HAVE_NUMBA
+from . import _backtest_kernel as _bk
+from .indicator_kernels import compute_all
+from .strategies import (TradingStrategies,
+                         KIND_NONE, KIND_BUY, KIND_SELL,
+                         _MACD_BULL, _MACD_BEAR,
+                         _BB_BUY_REASON, _BB_SELL_REASON)
+
+log = logging.getLogger(__name__)
+
+# Same directory the bot uses for its state snapshots (gitignored)
+_CACHE_DIR = '.cache'
 
 class Backtester:
     def __init__(self, symbol, start_date, end_date=None, initial_capital=10000):
@@ -12,13 +28,52 @@ class Backtester:
         self.initial_capital = initial_capital
         self.capital = initial_capital
         self.position = 0  # Number of shares held
-        self.trades = []
+        # SoA trade log: numeric fields live in parallel numpy arrays
+        # (grown by doubling); dates and reason strings stay in plain
+        # lists since they are Python objects either way. Dict records
+        # are only materialized when a report asks for them.
+        self._t_type = np.empty(0, dtype=np.uint8)  # 0 = BUY, 1 = SELL
+        self._t_price = np.empty(0)
+        self._t_shares = np.empty(0, dtype=np.int64)
+        self._t_flow = np.empty(0)  # cost for buys, revenue for sells
+        self._t_capital = np.empty(0)
+        self._n_trades = 0
+        self._t_dates = []
+        self._t_reasons = []
         self.strategies = TradingStrategies()
     
+    def _cache_path(self, interval):
+        """Cache file keyed by symbol, date range and interval.
+
+        The end date is part of the key at day resolution, so a rerun on
+        a later day misses the cache and refetches instead of serving
+        stale bars.
+        """
+        start = pd.Timestamp(self.start_date).strftime('%Y%m%d')
+        end = pd.Timestamp(self.end_date).strftime('%Y%m%d')
+        return os.path.join(_CACHE_DIR, f"{self.symbol}_{start}_{end}_{interval}.pkl")
+
     def get_historical_data(self, interval='1d'):
-        """Fetch historical data for backtesting"""
+        """Fetch historical data for backtesting, cached on disk.
+
+        Iterative tuning reruns the same (symbol, range, interval) many
+        times; reading the pickle back beats the yfinance round-trip by
+        a couple of orders of magnitude.
+        """
+        path = self._cache_path(interval)
+        if os.path.exists(path):
+            try:
+                return pd.read_pickle(path)
+            except Exception:
+                pass  # Unreadable cache file: fall through and refetch
         ticker = yf.Ticker(self.symbol)
         df = ticker.history(start=self.start_date, end=self.end_date, interval=interval)
+        if not df.empty:
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                df.to_pickle(path)
+            except OSError:
+                pass  # Caching is best-effort; the fetch still succeeded
         return df
     
     def analyze_signals(self, df) -> list:
@@ -49,74 +104,260 @@ class Backtester:
     
         return signals
     
+    def _indicator_arrays(self, df):
+        """Indicator arrays for a fetched frame: one fused compiled kernel
+        when numba is available, the ta library otherwise (the kernels
+        follow ta's formulas, so values match either way).
+        """
+        close = df['Close'].to_numpy(dtype='float64')
+        if HAVE_NUMBA:
+            rsi, macd, macd_sig, bb_high, bb_low, _ = compute_all(
+                close, df['Volume'].to_numpy(dtype='float64'))
+        else:
+            rsi = ta.momentum.RSIIndicator(df['Close']).rsi().to_numpy()
+            macd_ind = ta.trend.MACD(df['Close'])
+            macd = macd_ind.macd().to_numpy()
+            macd_sig = macd_ind.macd_signal().to_numpy()
+            bollinger = ta.volatility.BollingerBands(df['Close'])
+            bb_high = bollinger.bollinger_hband().to_numpy()
+            bb_low = bollinger.bollinger_lband().to_numpy()
+        return close, rsi, macd, macd_sig, bb_high, bb_low
+
+    def grid_search(self, param_grid, interval='1d', processes=None):
+        """Sweep strategy parameters over one fetched dataset in parallel.
+
+        param_grid is an iterable of dicts with any of 'rsi_buy',
+        'rsi_sell' and 'band_margin'. The data and indicators are
+        fetched/computed once; every candidate then runs the compiled
+        screening kernel in a multiprocessing pool, one core per worker.
+        The kernel scores candidates with a simplified any-signal state
+        machine (no swing strategies), so use run_backtest on the
+        winners for full-fidelity numbers. Returns result dicts sorted
+        by return_pct, best first.
+        """
+        df = self.get_historical_data(interval)
+        if df.empty:
+            return []
+        close, rsi, macd, macd_sig, bb_high, bb_low = self._indicator_arrays(df)
+        worker = partial(_evaluate_params, close, rsi, macd, macd_sig,
+                         bb_high, bb_low, initial_capital=self.initial_capital)
+        with Pool(processes) as pool:
+            results = pool.map(worker, list(param_grid))
+        results.sort(key=lambda r: r['return_pct'], reverse=True)
+        return results
+
     def run_backtest(self, interval='1d'):
         """Run backtest and return performance metrics"""
         try:
-            print(f"Starting backtest for {self.symbol} from {self.start_date}")
+            log.info("Starting backtest for %s from %s", self.symbol, self.start_date)
             df = self.get_historical_data(interval)
             if df.empty:
                 return None
             
-            # Calculate technical indicators
-            df['RSI'] = ta.momentum.RSIIndicator(df['Close']).rsi()
-            macd = ta.trend.MACD(df['Close'])
-            df['MACD'] = macd.macd()
-            df['MACD_signal'] = macd.macd_signal()
-            bollinger = ta.volatility.BollingerBands(df['Close'])
-            df['BB_high'] = bollinger.bollinger_hband()
-            df['BB_low'] = bollinger.bollinger_lband()
+            close, rsi, macd, macd_sig, bb_high, bb_low = self._indicator_arrays(df)
+            
+            # The swing strategies still read these as prefix columns
+            df['RSI'] = rsi
+            df['MACD'] = macd
+            df['MACD_signal'] = macd_sig
+            df['BB_high'] = bb_high
+            df['BB_low'] = bb_low
+            
+            dates = df.index
+            
+            band_margin = 0.005  # Same 0.5% touch margin as bollinger_bands_strategy
+            
+            # One vectorized pass builds boolean masks for every strategy
+            # condition; the Python loop below then only visits bars where
+            # something can actually fire (typically a few percent of N)
+            n = len(df)
+            buy_rsi = rsi < 35
+            sell_rsi = rsi > 65
+            cross_up = np.zeros(n, dtype=bool)
+            cross_dn = np.zeros(n, dtype=bool)
+            cross_up[1:] = (macd[1:] > macd_sig[1:]) & (macd[:-1] <= macd_sig[:-1])
+            cross_dn[1:] = (macd[1:] < macd_sig[1:]) & (macd[:-1] >= macd_sig[:-1])
+            buy_bb = close < bb_low * (1 + band_margin)
+            sell_bb = close > bb_high * (1 - band_margin)
+            swing_gate = np.zeros(n, dtype=bool)
+            swing_gate[1:] = (((rsi[1:] < 40) & (rsi[1:] > rsi[:-1]))
+                              | ((rsi[1:] > 60) & (rsi[1:] < rsi[:-1])))
             
-            results = []
-            for i in range(len(df)):
-                current_data = df.iloc[:i+1]
-                if len(current_data) < 20:  # Need enough data for indicators
-                    continue
-                    
-                signals = self.analyze_signals(current_data)
-                price = current_data['Close'].iloc[-1]
-                date = current_data.index[-1]
-                
-                for signal in signals:
-                    if signal.type == 'BUY' and self.position == 0:
+            if HAVE_NUMBA:
+                # Compiled path: the swing strategies still need Python
+                # (they walk DataFrame prefixes), so they are evaluated
+                # up front on their gated bars and handed to the kernel
+                # as events; the kernel then runs the whole state
+                # machine in one native pass and we translate its trade
+                # rows back into the columnar log
+                swing_gate[:19] = False
+                swing_idx, swing_kind, swing_reasons = self._swing_events(
+                    df, swing_gate)
+                trades_arr, _, cash, position = _bk.backtest_kernel(
+                    close, rsi, macd, macd_sig, bb_high, bb_low,
+                    swing_idx, swing_kind, float(self.capital))
+                self._ingest_kernel_trades(trades_arr, dates, rsi,
+                                           swing_reasons)
+                self.capital = float(cash)
+                self.position = int(position)
+                return self.calculate_metrics()
+
+            active = (buy_rsi | sell_rsi | cross_up | cross_dn
+                      | buy_bb | sell_bb | swing_gate)
+            active[:19] = False  # Need enough data for indicators
+
+            for i in np.flatnonzero(active):
+                price = close[i]
+                date = dates[i]
+                candidates = []  # (kind, reason) pairs, no Signal objects
+
+                # Allocation-free kind variants: the masks decide whether
+                # a bar is worth a call, the strategies own thresholds and
+                # wording, and nothing is materialized on quiet bars
+
+                if buy_rsi[i] or sell_rsi[i]:
+                    kind, _, reason = TradingStrategies.rsi_strategy_kind(rsi[i], price)
+                    if kind != KIND_NONE:
+                        candidates.append((kind, reason))
+
+                if cross_up[i] or cross_dn[i]:
+                    kind, _, reason = TradingStrategies.macd_cross_strategy_kind(
+                        macd[i], macd_sig[i], macd[i-1], macd_sig[i-1], price)
+                    if kind != KIND_NONE:
+                        candidates.append((kind, reason))
+
+                if buy_bb[i] or sell_bb[i]:
+                    kind, _, reason = TradingStrategies.bollinger_bands_strategy_kind(
+                        price, bb_high[i], bb_low[i])
+                    if kind != KIND_NONE:
+                        candidates.append((kind, reason))
+
+                # The swing strategies walk the whole prefix, but they can
+                # only fire when their RSI gate holds, so the expensive
+                # support/resistance work is skipped on all other bars
+                if swing_gate[i]:
+                    current_data = df.iloc[:i+1]
+                    for signal in (TradingStrategies.swing_trade_strategy(current_data),
+                                   TradingStrategies.swing_trade_strategy_with_fibonacci(current_data)):
+                        if signal:
+                            candidates.append((KIND_BUY if signal.type == 'BUY'
+                                               else KIND_SELL, signal.reason))
+
+                for kind, reason in candidates:
+                    if kind == KIND_BUY and self.position == 0:
                         # Calculate position size (invest 95% of capital)
                         shares = int((self.capital * 0.95) / price)
                         cost = shares * price
                         self.capital -= cost
                         self.position = shares
-                        self.trades.append({
-                            'date': date,
-                            'type': 'BUY',
-                            'price': price,
-                            'shares': shares,
-                            'cost': cost,
-                            'capital': self.capital,
-                            'reason': signal.reason
-                        })
-                        
-                    elif signal.type == 'SELL' and self.position > 0:
+                        self._record_trade(0, date, price, shares, cost, reason)
+
+                    elif kind == KIND_SELL and self.position > 0:
                         # Sell all shares
                         revenue = self.position * price
                         self.capital += revenue
-                        self.trades.append({
-                            'date': date,
-                            'type': 'SELL',
-                            'price': price,
-                            'shares': self.position,
-                            'revenue': revenue,
-                            'capital': self.capital,
-                            'reason': signal.reason
-                        })
+                        self._record_trade(1, date, price, self.position, revenue, reason)
                         self.position = 0
             
             return self.calculate_metrics()
         
         except Exception as e:
-            print(f"Backtest error: {e}")
+            log.error("Backtest error: %s", e)
             return None
     
+    def _swing_events(self, df, swing_gate):
+        """Pre-evaluate the swing strategies on their gated bars.
+
+        Returns (bar_indices, kinds, reasons): int64 event arrays the
+        compiled kernel can merge into its single pass (kind 0=BUY,
+        1=SELL) plus the matching reason strings, indexed from
+        SWING_REASON_BASE in the kernel's trade rows.
+        """
+        idx = []
+        kinds = []
+        reasons = []
+        for i in np.flatnonzero(swing_gate):
+            current_data = df.iloc[:i + 1]
+            for signal in (TradingStrategies.swing_trade_strategy(current_data),
+                           TradingStrategies.swing_trade_strategy_with_fibonacci(current_data)):
+                if signal:
+                    idx.append(i)
+                    kinds.append(0 if signal.type == 'BUY' else 1)
+                    reasons.append(signal.reason)
+        return (np.asarray(idx, dtype=np.int64),
+                np.asarray(kinds, dtype=np.int64),
+                reasons)
+
+    def _ingest_kernel_trades(self, trades_arr, dates, rsi, swing_reasons):
+        """Translate compiled-kernel trade rows into the columnar log.
+
+        Reason strings are only formatted here, once per executed trade,
+        from the codes the kernel recorded.
+        """
+        for row in trades_arr:
+            i = int(row[0])
+            code = int(row[6])
+            if code >= _bk.SWING_REASON_BASE:
+                reason = swing_reasons[code - _bk.SWING_REASON_BASE]
+            elif code == _bk.REASON_RSI_BUY:
+                reason = f'RSI oversold: {rsi[i]:.2f}'
+            elif code == _bk.REASON_RSI_SELL:
+                reason = f'RSI overbought: {rsi[i]:.2f}'
+            elif code == _bk.REASON_MACD_BUY:
+                reason = _MACD_BULL
+            elif code == _bk.REASON_MACD_SELL:
+                reason = _MACD_BEAR
+            elif code == _bk.REASON_BB_BUY:
+                reason = _BB_BUY_REASON
+            else:
+                reason = _BB_SELL_REASON
+            # _record_trade snapshots self.capital, so track the kernel's
+            # running capital while replaying its trades
+            self.capital = float(row[5])
+            self._record_trade(int(row[1]), dates[i], float(row[2]),
+                               int(row[3]), float(row[4]), reason)
+
+    def _record_trade(self, kind, date, price, shares, flow, reason):
+        """Append one trade to the columnar log, growing arrays by doubling"""
+        i = self._n_trades
+        if i == len(self._t_price):
+            grow = max(64, 2 * len(self._t_price))
+            self._t_type = np.resize(self._t_type, grow)
+            self._t_price = np.resize(self._t_price, grow)
+            self._t_shares = np.resize(self._t_shares, grow)
+            self._t_flow = np.resize(self._t_flow, grow)
+            self._t_capital = np.resize(self._t_capital, grow)
+        self._t_type[i] = kind
+        self._t_price[i] = price
+        self._t_shares[i] = shares
+        self._t_flow[i] = flow
+        self._t_capital[i] = self.capital
+        self._t_dates.append(date)
+        self._t_reasons.append(reason)
+        self._n_trades = i + 1
+
+    def _trades_as_dicts(self):
+        """Materialize the columnar log as the dict records callers expect"""
+        kinds = ('BUY', 'SELL')
+        flow_keys = ('cost', 'revenue')
+        trades = []
+        for i in range(self._n_trades):
+            kind = self._t_type[i]
+            trades.append({
+                'date': self._t_dates[i],
+                'type': kinds[kind],
+                'price': float(self._t_price[i]),
+                'shares': int(self._t_shares[i]),
+                flow_keys[kind]: float(self._t_flow[i]),
+                'capital': float(self._t_capital[i]),
+                'reason': self._t_reasons[i],
+            })
+        return trades
+
     def calculate_metrics(self):
         """Calculate performance metrics"""
-        if not self.trades:
+        n = self._n_trades
+        if n == 0:
             return {
                 'total_trades': 0,
                 'profitable_trades': 0,
@@ -125,23 +366,83 @@ class Backtester:
                 'trades': []
             }
         
-        profitable_trades = 0
-        for i in range(0, len(self.trades) - 1, 2):
-            if i + 1 < len(self.trades):
-                buy = self.trades[i]
-                sell = self.trades[i + 1]
-                profit = sell['revenue'] - buy['cost']
-                if profit > 0:
-                    profitable_trades += 1
+        # Completed round trips are adjacent (buy, sell) pairs; flow holds
+        # cost for buys and revenue for sells, so one strided subtraction
+        # scores every pair at once
+        flow = self._t_flow[:n - (n % 2)]
+        profitable_trades = int((flow[1::2] - flow[0::2] > 0).sum())
         
-        final_capital = self.capital + (self.position * self.trades[-1]['price'] if self.position > 0 else 0)
+        final_capital = self.capital + (self.position * self._t_price[n - 1] if self.position > 0 else 0)
         total_return = final_capital - self.initial_capital
         return_pct = (total_return / self.initial_capital) * 100
         
         return {
-            'total_trades': len(self.trades) // 2,
+            'total_trades': n // 2,
             'profitable_trades': profitable_trades,
             'total_return': total_return,
             'return_pct': return_pct,
-            'trades': self.trades
-        }
\ No newline at end of file
+            'trades': self._trades_as_dicts()
+        }
+
+@njit(cache=True, nogil=True)
+def _grid_kernel(close, rsi, macd, macd_sig, bb_high, bb_low,
+                 rsi_buy, rsi_sell, band_margin, initial_capital):
+    """Score one parameter set: any-signal BUY/SELL state machine.
+
+    nogil lets a thread pool scale this too when the arrays are big
+    enough that process startup would dominate. Returns
+    (final_capital, trade_count).
+    """
+    capital = initial_capital
+    position = 0
+    trades = 0
+    price = 0.0
+    for i in range(19, close.shape[0]):
+        price = close[i]
+        buy = (rsi[i] < rsi_buy
+               or (macd[i - 1] <= macd_sig[i - 1] and macd[i] > macd_sig[i])
+               or price < bb_low[i] * (1.0 + band_margin))
+        sell = (rsi[i] > rsi_sell
+                or (macd[i - 1] >= macd_sig[i - 1] and macd[i] < macd_sig[i])
+                or price > bb_high[i] * (1.0 - band_margin))
+        if position == 0 and buy:
+            shares = int((capital * 0.95) / price)
+            if shares > 0:
+                capital -= shares * price
+                position = shares
+                trades += 1
+        elif position > 0 and sell:
+            capital += position * price
+            position = 0
+            trades += 1
+    if position > 0:
+        capital += position * price  # Mark the open position to market
+    return capital, trades
+
+
+def _evaluate_params(close, rsi, macd, macd_sig, bb_high, bb_low, params,
+                     initial_capital=10000):
+    """Module-level sweep worker, picklable for multiprocessing.Pool"""
+    final_capital, trades = _grid_kernel(
+        close, rsi, macd, macd_sig, bb_high, bb_low,
+        float(params.get('rsi_buy', 35.0)),
+        float(params.get('rsi_sell', 65.0)),
+        float(params.get('band_margin', 0.005)),
+        float(initial_capital))
+    total_return = final_capital - initial_capital
+    return {
+        'params': params,
+        'total_trades': trades // 2,
+        'total_return': total_return,
+        'return_pct': (total_return / initial_capital) * 100,
+    }
+
+
+def run_backtest_worker(symbol, start_date, initial_capital):
+    """Module-level backtest entry point, picklable for worker processes.
+
+    The UI submits this to a ProcessPoolExecutor so the multi-second
+    CPU-bound backtest runs outside the GIL and the window stays live.
+    """
+    backtester = Backtester(symbol, start_date, initial_capital=initial_capital)
+    return backtester.run_backtest()
@@ -0,0 +1,53 @@
+import time
+
+# Seconds per bar for the intervals the UI exposes
+INTERVAL_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+    '1d': 86400,
+}
+
+
+class DataCache:
+    """
+    In-memory TTL cache for fetched price data, keyed by (symbol, interval).
+
+    yfinance only produces a new bar once per interval, so refetching more
+    often than that just re-downloads identical rows. A cached frame is
+    considered fresh until the next bar close after it was fetched.
+    """
+
+    def __init__(self):
+        self._entries = {}  # (symbol, interval) -> (fetched_at, DataFrame)
+
+    def get(self, symbol, interval):
+        """Return the cached DataFrame if still fresh, else None"""
+        entry = self._entries.get((symbol, interval))
+        if entry is None:
+            return None
+
+        fetched_at, df = entry
+        bar_seconds = INTERVAL_SECONDS.get(interval, 60)
+        now = time.time()
+
+        # The next bar closes at the interval boundary after the fetch;
+        # until then the upstream data cannot have a new completed bar.
+        next_bar_close = (fetched_at // bar_seconds + 1) * bar_seconds
+        if now < next_bar_close:
+            return df
+        return None
+
+    def put(self, symbol, interval, df):
+        """Store a freshly fetched DataFrame"""
+        self._entries[(symbol, interval)] = (time.time(), df)
+
+    def clear(self, symbol=None):
+        """Drop cached entries (for one symbol, or everything)"""
+        if symbol is None:
+            self._entries.clear()
+        else:
+            self._entries = {k: v for k, v in self._entries.items()
+                             if k[0] != symbol}
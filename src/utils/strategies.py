@@ -1,13 +1,45 @@
+import logging
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._njit import njit, HAVE_NUMBA
+
+# Per-call diagnostics go to DEBUG so backtests over thousands of bars
+# don't pay for stdout writes
+log = logging.getLogger(__name__)
+
+# slots drops the per-instance __dict__ (signals are allocated in bulk
+# during backtests) and frozen makes accidental mutation impossible
+@dataclass(slots=True, frozen=True)
 class Signal:
     type: str  # 'BUY' or 'SELL'
     price: float
     reason: str
     strength: float  # 0-1 signal strength
 
+# Integer kinds used by the allocation-free *_kind strategy variants
+KIND_NONE = 0
+KIND_BUY = 1
+KIND_SELL = 2
+_KIND_NAMES = (None, 'BUY', 'SELL')
+
+# Fixed reason messages as module constants: interned once instead of
+# rebuilt per call, and shared by every variant of the same strategy
+_MACD_BULL = 'MACD bullish crossover'
+_MACD_BEAR = 'MACD bearish crossover'
+_BB_BUY_REASON = 'Price near lower Bollinger Band'
+_BB_SELL_REASON = 'Price near upper Bollinger Band'
+
+# Hoisted threshold constants: the 0.5% Bollinger touch margin is fixed
+# across every variant, and the RSI thresholds share one default
+_BB_MARGIN_LOW = 1.005   # 1 + margin, applied to the lower band
+_BB_MARGIN_HIGH = 0.995  # 1 - margin, applied to the upper band
+_RSI_BUY_DEFAULT = 35
+_RSI_SELL_DEFAULT = 65
+
 class TradingStrategies:
     """
     Collection of trading strategies using various technical indicators.
@@ -16,7 +48,7 @@ class TradingStrategies:
     """
     
     @staticmethod
-    def rsi_strategy(df, rsi_buy=35, rsi_sell=65) -> Optional[Signal]:
+    def rsi_strategy(df, rsi_buy=_RSI_BUY_DEFAULT, rsi_sell=_RSI_SELL_DEFAULT) -> Optional[Signal]:
         """
         RSI (Relative Strength Index) Strategy
         
@@ -32,10 +64,11 @@ class TradingStrategies:
         - Below 30: Typically considered oversold
         - Above 70: Typically considered overbought
         """
-        current_rsi = df['RSI'].iloc[-1]
-        price = df['Close'].iloc[-1]
-        
-        print(f"Current RSI: {current_rsi}")
+        # .values[-1] skips the Series-construction path .iloc goes through
+        current_rsi = df['RSI'].values[-1]
+        price = df['Close'].values[-1]
+
+        log.debug("Current RSI: %s", current_rsi)
         
         if current_rsi < rsi_buy:
             strength = 1 - (current_rsi / rsi_buy)  # Stronger signal when RSI is lower
@@ -66,22 +99,124 @@ class TradingStrategies:
         if len(df) < 2:
             return None
             
-        current_macd = df['MACD'].iloc[-1]
-        current_signal = df['MACD_signal'].iloc[-1]
-        prev_macd = df['MACD'].iloc[-2]
-        prev_signal = df['MACD_signal'].iloc[-2]
-        price = df['Close'].iloc[-1]
+        # Grab each column's ndarray once and index the tail directly
+        macd = df['MACD'].values
+        sig = df['MACD_signal'].values
+        current_macd = macd[-1]
+        current_signal = sig[-1]
+        prev_macd = macd[-2]
+        prev_signal = sig[-2]
+        price = df['Close'].values[-1]
         
-        print(f"MACD: {current_macd:.2f}, Signal: {current_signal:.2f}")
+        log.debug("MACD: %.2f, Signal: %.2f", current_macd, current_signal)
         
         if (prev_macd <= prev_signal and current_macd > current_signal):
             strength = min(1.0, abs(current_macd - current_signal))
-            return Signal('BUY', price, 'MACD bullish crossover', strength)
+            return Signal('BUY', price, _MACD_BULL, strength)
         elif (prev_macd >= prev_signal and current_macd < current_signal):
             strength = min(1.0, abs(current_macd - current_signal))
-            return Signal('SELL', price, 'MACD bearish crossover', strength)
+            return Signal('SELL', price, _MACD_BEAR, strength)
         return None
 
+    @staticmethod
+    def rsi_strategy_kind(current_rsi, price,
+                          rsi_buy=_RSI_BUY_DEFAULT, rsi_sell=_RSI_SELL_DEFAULT):
+        """Allocation-free twin of rsi_strategy for hot loops.
+
+        Returns (kind, strength, reason) with kind KIND_NONE / KIND_BUY /
+        KIND_SELL; no Signal object is built and the reason string is
+        only formatted on the firing branch, so a backtest that visits
+        millions of quiet bars allocates nothing per call.
+        """
+        if current_rsi < rsi_buy:
+            return (KIND_BUY, 1 - (current_rsi / rsi_buy),
+                    f'RSI oversold: {current_rsi:.2f}')
+        if current_rsi > rsi_sell:
+            return (KIND_SELL, (current_rsi - rsi_sell) / (100 - rsi_sell),
+                    f'RSI overbought: {current_rsi:.2f}')
+        return (KIND_NONE, 0.0, '')
+
+    @staticmethod
+    def macd_cross_strategy_kind(current_macd, current_signal,
+                                 prev_macd, prev_signal, price):
+        """Allocation-free twin of macd_cross_strategy (see rsi_strategy_kind)"""
+        if prev_macd <= prev_signal and current_macd > current_signal:
+            return (KIND_BUY, min(1.0, abs(current_macd - current_signal)),
+                    _MACD_BULL)
+        if prev_macd >= prev_signal and current_macd < current_signal:
+            return (KIND_SELL, min(1.0, abs(current_macd - current_signal)),
+                    _MACD_BEAR)
+        return (KIND_NONE, 0.0, '')
+
+    @staticmethod
+    def rsi_strategy_batch(rsi_last, close_last,
+                           rsi_buy=_RSI_BUY_DEFAULT, rsi_sell=_RSI_SELL_DEFAULT):
+        """Vectorized rsi_strategy across many tickers at once.
+
+        Takes the latest RSI and close per ticker as 1-D arrays and
+        returns (kinds, prices, strengths) ndarrays using the same
+        KIND_* codes and strength formulas as the scalar variants, so a
+        screen over N symbols is a few ufunc calls instead of N Python
+        strategy invocations.
+        """
+        buy = rsi_last < rsi_buy
+        sell = rsi_last > rsi_sell
+        kinds = np.where(buy, KIND_BUY, np.where(sell, KIND_SELL, KIND_NONE))
+        strengths = np.where(buy, 1 - rsi_last / rsi_buy,
+                             np.where(sell,
+                                      (rsi_last - rsi_sell) / (100 - rsi_sell),
+                                      0.0))
+        return kinds, close_last, strengths
+
+    @staticmethod
+    def macd_cross_strategy_batch(macd_last, sig_last, macd_prev, sig_prev,
+                                  close_last):
+        """Vectorized macd_cross_strategy (see rsi_strategy_batch)"""
+        buy = (macd_prev <= sig_prev) & (macd_last > sig_last)
+        sell = (macd_prev >= sig_prev) & (macd_last < sig_last)
+        kinds = np.where(buy, KIND_BUY, np.where(sell, KIND_SELL, KIND_NONE))
+        strengths = np.where(buy | sell,
+                             np.minimum(1.0, np.abs(macd_last - sig_last)),
+                             0.0)
+        return kinds, close_last, strengths
+
+    @staticmethod
+    def bollinger_bands_strategy_batch(close_last, bb_high_last, bb_low_last):
+        """Vectorized bollinger_bands_strategy (see rsi_strategy_batch)"""
+        buy = close_last < bb_low_last * _BB_MARGIN_LOW
+        sell = close_last > bb_high_last * _BB_MARGIN_HIGH
+        kinds = np.where(buy, KIND_BUY, np.where(sell, KIND_SELL, KIND_NONE))
+        strengths = np.where(buy, (bb_low_last - close_last) / bb_low_last,
+                             np.where(sell,
+                                      (close_last - bb_high_last) / bb_high_last,
+                                      0.0))
+        return kinds, close_last, strengths
+
+    @staticmethod
+    def rsi_strategy_scalar(current_rsi, price,
+                            rsi_buy=_RSI_BUY_DEFAULT, rsi_sell=_RSI_SELL_DEFAULT) -> Optional[Signal]:
+        """Scalar twin of rsi_strategy for array-driven backtests.
+
+        Same thresholds, strengths and reasons, but takes plain floats so
+        callers that already hold numpy arrays don't build a DataFrame
+        prefix per bar.
+        """
+        kind, strength, reason = TradingStrategies.rsi_strategy_kind(
+            current_rsi, price, rsi_buy, rsi_sell)
+        if kind == KIND_NONE:
+            return None
+        return Signal(_KIND_NAMES[kind], price, reason, strength)
+
+    @staticmethod
+    def macd_cross_strategy_scalar(current_macd, current_signal,
+                                   prev_macd, prev_signal, price) -> Optional[Signal]:
+        """Scalar twin of macd_cross_strategy for array-driven backtests"""
+        kind, strength, reason = TradingStrategies.macd_cross_strategy_kind(
+            current_macd, current_signal, prev_macd, prev_signal, price)
+        if kind == KIND_NONE:
+            return None
+        return Signal(_KIND_NAMES[kind], price, reason, strength)
+
     @staticmethod
     def bollinger_bands_strategy(df) -> Optional[Signal]:
         """
@@ -100,21 +235,41 @@ class TradingStrategies:
         - Based on how far price has moved beyond the bands
         - Uses 0.5% margin to detect band touches
         """
-        price = df['Close'].iloc[-1]
-        upper_band = df['BB_high'].iloc[-1]
-        lower_band = df['BB_low'].iloc[-1]
+        price = df['Close'].values[-1]
+        upper_band = df['BB_high'].values[-1]
+        lower_band = df['BB_low'].values[-1]
         
-        print(f"Price: {price:.2f}, BB Upper: {upper_band:.2f}, BB Lower: {lower_band:.2f}")
+        log.debug("Price: %.2f, BB Upper: %.2f, BB Lower: %.2f",
+                  price, upper_band, lower_band)
         
-        band_margin = 0.005  # 0.5% margin for band touches
-        if price < lower_band * (1 + band_margin):
+        if price < lower_band * _BB_MARGIN_LOW:
             strength = (lower_band - price) / lower_band
-            return Signal('BUY', price, 'Price near lower Bollinger Band', strength)
-        elif price > upper_band * (1 - band_margin):
+            return Signal('BUY', price, _BB_BUY_REASON, strength)
+        elif price > upper_band * _BB_MARGIN_HIGH:
             strength = (price - upper_band) / upper_band
-            return Signal('SELL', price, 'Price near upper Bollinger Band', strength)
+            return Signal('SELL', price, _BB_SELL_REASON, strength)
         return None
 
+    @staticmethod
+    def bollinger_bands_strategy_kind(price, upper_band, lower_band):
+        """Allocation-free twin of bollinger_bands_strategy (see rsi_strategy_kind)"""
+        if price < lower_band * _BB_MARGIN_LOW:
+            return (KIND_BUY, (lower_band - price) / lower_band,
+                    _BB_BUY_REASON)
+        if price > upper_band * _BB_MARGIN_HIGH:
+            return (KIND_SELL, (price - upper_band) / upper_band,
+                    _BB_SELL_REASON)
+        return (KIND_NONE, 0.0, '')
+
+    @staticmethod
+    def bollinger_bands_strategy_scalar(price, upper_band, lower_band) -> Optional[Signal]:
+        """Scalar twin of bollinger_bands_strategy for array-driven backtests"""
+        kind, strength, reason = TradingStrategies.bollinger_bands_strategy_kind(
+            price, upper_band, lower_band)
+        if kind == KIND_NONE:
+            return None
+        return Signal(_KIND_NAMES[kind], price, reason, strength)
+
     @staticmethod
     def volume_price_strategy(df) -> Optional[Signal]:
         """
@@ -137,14 +292,21 @@ class TradingStrategies:
         if len(df) < 20:
             return None
             
-        current_volume = df['Volume'].iloc[-1]
-        avg_volume = df['Volume'].rolling(window=20).mean().iloc[-1]
-        price = df['Close'].iloc[-1]
-        
-        print(f"Volume: {current_volume}, Avg Volume: {avg_volume}")
-        
+        current_volume = df['Volume'].values[-1]
+        if 'Volume_MA20' in df.columns:
+            # Precomputed once per frame by TradingBot.calculate_signals
+            avg_volume = df['Volume_MA20'].values[-1]
+        else:
+            # One reduction over the last 20 values instead of a full
+            # rolling series that gets thrown away bar one value
+            avg_volume = df['Volume'].values[-20:].mean()
+        close = df['Close'].values
+        price = close[-1]
+
+        log.debug("Volume: %s, Avg Volume: %s", current_volume, avg_volume)
+
         if current_volume > 1.5 * avg_volume:
-            price_change = (price - df['Close'].iloc[-2]) / df['Close'].iloc[-2]
+            price_change = (price - close[-2]) / close[-2]
             if price_change > 0:
                 return Signal('BUY', price, 'High volume price increase', min(1.0, current_volume/avg_volume - 1))
             elif price_change < 0:
@@ -167,46 +329,71 @@ class TradingStrategies:
         highs = df['High'].values
         lows = df['Low'].values
         volumes = df['Volume'].values
-        
-        support_levels = []
-        resistance_levels = []
-        
-        # Find pivot points
-        for i in range(window, len(df) - window):
-            # Potential support
-            if all(lows[i] <= lows[i-window:i]) and all(lows[i] <= lows[i+1:i+window]):
-                # Confirm with volume
-                if volumes[i] > volumes[i-window:i+window].mean():
-                    support_levels.append(lows[i])
-                    
-            # Potential resistance
-            if all(highs[i] >= highs[i-window:i]) and all(highs[i] >= highs[i+1:i+window]):
-                # Confirm with volume
-                if volumes[i] > volumes[i-window:i+window].mean():
-                    resistance_levels.append(highs[i])
+        n = len(lows)
+
+        if n < 2 * window:
+            return [], []
+
+        # Levels only depend on the frame contents, so cache them on the
+        # frame itself: both swing strategies call this per evaluation
+        # and hit the stored result instead of rescanning. Keying on
+        # (length, last close) catches both appended bars and switched
+        # symbols without hashing the whole frame.
+        cache_key = (n, float(df['Close'].values[-1]), window, threshold)
+        cached = df.attrs.get('_sr_levels')
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        if HAVE_NUMBA:
+            # Compiled scan with early-exit inner loops; same semantics
+            supports, n_sup, resistances, n_res = _find_pivots_loop(
+                np.asarray(lows, dtype=np.float64),
+                np.asarray(highs, dtype=np.float64),
+                np.asarray(volumes, dtype=np.float64), window)
+            support_levels = supports[:n_sup].tolist()
+            resistance_levels = resistances[:n_res].tolist()
+        else:
+            # Vectorized pivot scan: each sliding window covers the same
+            # i-window .. i+window-1 span the old Python loop compared bar i
+            # against, so a pivot is simply a center that equals its window's
+            # min (support) or max (resistance). The last window's center
+            # falls outside the loop's old range, hence the [:-1].
+            span = 2 * window
+            center_lows = lows[window:n - window]
+            center_highs = highs[window:n - window]
+            vol_ok = (volumes[window:n - window]
+                      > sliding_window_view(volumes, span)[:-1].mean(axis=1))
+            is_support = (center_lows
+                          <= sliding_window_view(lows, span)[:-1].min(axis=1))
+            is_resistance = (center_highs
+                             >= sliding_window_view(highs, span)[:-1].max(axis=1))
+
+            support_levels = center_lows[is_support & vol_ok].tolist()
+            resistance_levels = center_highs[is_resistance & vol_ok].tolist()
         
         # Cluster nearby levels
         def cluster_levels(levels, threshold):
             if not levels:
                 return []
-            levels = sorted(levels)
+            arr = np.sort(np.asarray(levels, dtype=np.float64))
             clustered = []
-            current_cluster = [levels[0]]
-            
-            for level in levels[1:]:
-                if (level - current_cluster[0]) / current_cluster[0] <= threshold:
-                    current_cluster.append(level)
-                else:
-                    clustered.append(sum(current_cluster) / len(current_cluster))
-                    current_cluster = [level]
-            
-            if current_cluster:
-                clustered.append(sum(current_cluster) / len(current_cluster))
+            i = 0
+            n_levels = len(arr)
+            # A cluster is every level within threshold of its anchor
+            # (the old per-level loop's current_cluster[0]); searchsorted
+            # finds each cluster's end in one bisect and the mean is one
+            # reduction, so the loop runs per cluster, not per level
+            while i < n_levels:
+                j = np.searchsorted(arr, arr[i] * (1.0 + threshold),
+                                    side='right')
+                clustered.append(arr[i:j].mean())
+                i = j
             return clustered
         
         support_levels = cluster_levels(support_levels, threshold)
         resistance_levels = cluster_levels(resistance_levels, threshold)
-        
+
+        df.attrs['_sr_levels'] = (cache_key, (support_levels, resistance_levels))
         return support_levels, resistance_levels
 
     @staticmethod
@@ -236,85 +423,100 @@ class TradingStrategies:
         - Volume surge adds to strength
         - Clear support/resistance levels increase strength
         """
-        try:
-            # Ensure there is enough data for analysis
-            if len(df) < 20:
-                return None
-                
-            # Get the current price and volume
-            current_price = df['Close'].iloc[-1]
-            current_volume = df['Volume'].iloc[-1]
-            avg_volume = df['Volume'].rolling(window=20).mean().iloc[-1]
-            rsi = df['RSI'].iloc[-1]
-            prev_rsi = df['RSI'].iloc[-2]
-            
-            # Find support and resistance levels
-            support_levels, resistance_levels = TradingStrategies.find_support_resistance(df)
-            
-            # Ensure we have valid support and resistance levels
-            if not support_levels or not resistance_levels:
-                return None
-                
-            # Find the nearest support and resistance levels
-            nearest_support = max([s for s in support_levels if s < current_price], default=None)
-            nearest_resistance = min([r for r in resistance_levels if r > current_price], default=None)
-            
-            # Ensure we have valid nearest levels
-            if not nearest_support or not nearest_resistance:
-                return None
-                
-            # Calculate price distances to support and resistance
-            support_distance = (current_price - nearest_support) / nearest_support
-            resistance_distance = (nearest_resistance - current_price) / current_price
-            
-            # Check for volume confirmation (surge)
-            volume_surge = current_volume > (1.5 * avg_volume)
-            
-            # Trend confirmation using recent lows and highs
-            last_5_lows = df['Low'].rolling(window=5).min()
-            last_5_highs = df['High'].rolling(window=5).max()
-            higher_lows = last_5_lows.iloc[-1] > last_5_lows.iloc[-5]  # Check for higher lows
-            lower_highs = last_5_highs.iloc[-1] < last_5_highs.iloc[-5]  # Check for lower highs
-            
-            # BUY Signal Conditions
-            if (support_distance < 0.02  # Price near support (2% threshold)
-                and higher_lows  # Confirm upward trend
-                and rsi < 40 and rsi > prev_rsi):  # RSI oversold but rising
-                
-                # Calculate signal strength factors
-                strength_factors = [
-                    0.3,  # Base strength
-                    0.2 if volume_surge else 0,  # Add strength if volume surges
-                    0.3 if rsi < 30 else 0.1,  # Add strength if RSI is very low
-                    0.2 * (1 - support_distance/0.02)  # Proximity to support increases strength
-                ]
-                
-                strength = min(1.0, sum(strength_factors))  # Calculate total strength
-                reason = f"Swing Trade BUY: Near support {nearest_support:.2f}"  # Reason for the signal
-                return Signal('BUY', current_price, reason, strength)  # Return the BUY signal
-                
-            # SELL Signal Conditions
-            elif (resistance_distance < 0.02  # Price near resistance (2% threshold)
-                  and lower_highs  # Confirm downward trend
-                  and rsi > 60 and rsi < prev_rsi):  # RSI overbought and falling
-                
-                # Calculate signal strength factors
-                strength_factors = [
-                    0.3,  # Base strength
-                    0.2 if volume_surge else 0,  # Add strength if volume surges
-                    0.3 if rsi > 70 else 0.1,  # Add strength if RSI is very high
-                    0.2 * (1 - resistance_distance/0.02)  # Proximity to resistance increases strength
-                ]
-                
-                strength = min(1.0, sum(strength_factors))  # Calculate total strength
-                reason = f"Swing Trade SELL: Near resistance {nearest_resistance:.2f}"  # Reason for the signal
-                return Signal('SELL', current_price, reason, strength)  # Return the SELL signal
-                
-            return None  # No signal generated
-            
-        except Exception as e:
-            print(f"Swing strategy error: {e}")  # Log any errors
+        # Ensure there is enough data (and computed indicators) for
+        # analysis; the broad exception handler that used to swallow a
+        # missing-column KeyError is gone
+        if len(df) < 20 or 'RSI' not in df.columns:
+            return None
+
+        # Get the current price and volume
+        current_price = df['Close'].values[-1]
+        current_volume = df['Volume'].values[-1]
+        # Tail reductions: only the last window of each rolling
+        # statistic is ever read, so compute just that
+        avg_volume = df['Volume'].values[-20:].mean()
+        rsi_arr = df['RSI'].values
+        rsi = rsi_arr[-1]
+        prev_rsi = rsi_arr[-2]
+
+        # Cheapest gate first: every signal below requires one of
+        # these RSI patterns, so most bars return before paying for
+        # the support/resistance scan
+        if not ((rsi < 40 and rsi > prev_rsi)
+                or (rsi > 60 and rsi < prev_rsi)):
+            return None
+
+        # Find support and resistance levels
+        support_levels, resistance_levels = TradingStrategies.find_support_resistance(df)
+
+        # Ensure we have valid support and resistance levels
+        if not support_levels or not resistance_levels:
             return None
+
+        # Levels come back sorted from cluster_levels, so the nearest
+        # level on each side is a binary search instead of two list
+        # traversals (side='left'/'right' keeps the strict <, >)
+        support_arr = np.asarray(support_levels)
+        resistance_arr = np.asarray(resistance_levels)
+        idx = np.searchsorted(support_arr, current_price, side='left')
+        nearest_support = float(support_arr[idx - 1]) if idx > 0 else None
+        idx = np.searchsorted(resistance_arr, current_price, side='right')
+        nearest_resistance = (float(resistance_arr[idx])
+                              if idx < len(resistance_arr) else None)
+
+        # Ensure we have valid nearest levels
+        if not nearest_support or not nearest_resistance:
+            return None
+
+        # Calculate price distances to support and resistance
+        support_distance = (current_price - nearest_support) / nearest_support
+        resistance_distance = (nearest_resistance - current_price) / current_price
+
+        # Check for volume confirmation (surge)
+        volume_surge = current_volume > (1.5 * avg_volume)
+
+        # Trend confirmation using recent lows and highs
+        lows = df['Low'].values
+        highs = df['High'].values
+        higher_lows = lows[-5:].min() > lows[-9:-4].min()  # Check for higher lows
+        lower_highs = highs[-5:].max() < highs[-9:-4].max()  # Check for lower highs
+
+        # BUY Signal Conditions
+        if (support_distance < 0.02  # Price near support (2% threshold)
+            and higher_lows  # Confirm upward trend
+            and rsi < 40 and rsi > prev_rsi):  # RSI oversold but rising
+
+            # Calculate signal strength factors
+            strength_factors = [
+                0.3,  # Base strength
+                0.2 if volume_surge else 0,  # Add strength if volume surges
+                0.3 if rsi < 30 else 0.1,  # Add strength if RSI is very low
+                0.2 * (1 - support_distance/0.02)  # Proximity to support increases strength
+            ]
+
+            strength = min(1.0, sum(strength_factors))  # Calculate total strength
+            reason = f"Swing Trade BUY: Near support {nearest_support:.2f}"  # Reason for the signal
+            return Signal('BUY', current_price, reason, strength)  # Return the BUY signal
+
+        # SELL Signal Conditions
+        elif (resistance_distance < 0.02  # Price near resistance (2% threshold)
+              and lower_highs  # Confirm downward trend
+              and rsi > 60 and rsi < prev_rsi):  # RSI overbought and falling
+
+            # Calculate signal strength factors
+            strength_factors = [
+                0.3,  # Base strength
+                0.2 if volume_surge else 0,  # Add strength if volume surges
+                0.3 if rsi > 70 else 0.1,  # Add strength if RSI is very high
+                0.2 * (1 - resistance_distance/0.02)  # Proximity to resistance increases strength
+            ]
+
+            strength = min(1.0, sum(strength_factors))  # Calculate total strength
+            reason = f"Swing Trade SELL: Near resistance {nearest_resistance:.2f}"  # Reason for the signal
+            return Signal('SELL', current_price, reason, strength)  # Return the SELL signal
+
+        return None  # No signal generated
+
         
     @staticmethod
     def fibonacci_retracement(df) -> tuple:
@@ -369,67 +571,121 @@ class TradingStrategies:
         - Volume surge adds to strength
         - Clear Fibonacci levels increase strength
         """
-        try:
-            # Ensure there is enough data for analysis
-            if len(df) < 20:
-                return None
-                
-            # Get the current price and volume
-            current_price = df['Close'].iloc[-1]
-            current_volume = df['Volume'].iloc[-1]
-            avg_volume = df['Volume'].rolling(window=20).mean().iloc[-1]
-            rsi = df['RSI'].iloc[-1]
-            prev_rsi = df['RSI'].iloc[-2]
-            
-            # Calculate Fibonacci retracement levels
-            fib_levels = TradingStrategies.fibonacci_retracement(df)
-            level_0, level_236, level_382, level_618, level_1 = fib_levels
-            
-            # Check for volume confirmation (surge)
-            volume_surge = current_volume > (1.5 * avg_volume)
-            
-            # Trend confirmation using recent lows and highs
-            last_5_lows = df['Low'].rolling(window=5).min()
-            last_5_highs = df['High'].rolling(window=5).max()
-            higher_lows = last_5_lows.iloc[-1] > last_5_lows.iloc[-5]  # Check for higher lows
-            lower_highs = last_5_highs.iloc[-1] < last_5_highs.iloc[-5]  # Check for lower highs
-            
-            # BUY Signal Conditions
-            if (current_price <= level_382  # Price near Fibonacci support level
-                and higher_lows  # Confirm upward trend
-                and rsi < 40 and rsi > prev_rsi):  # RSI oversold but rising
-                
-                # Calculate signal strength factors
-                strength_factors = [
-                    0.3,  # Base strength
-                    0.2 if volume_surge else 0,  # Add strength if volume surges
-                    0.3 if rsi < 30 else 0.1,  # Add strength if RSI is very low
-                    0.2 * (1 - (current_price - level_382) / (level_0 - level_382))  # Proximity to support increases strength
-                ]
-                
-                strength = min(1.0, sum(strength_factors))  # Calculate total strength
-                reason = f"Swing Trade BUY: Near Fibonacci support {level_382:.2f}"  # Reason for the signal
-                return Signal('BUY', current_price, reason, strength)  # Return the BUY signal
-                
-            # SELL Signal Conditions
-            elif (current_price >= level_618  # Price near Fibonacci resistance level
-                and lower_highs  # Confirm downward trend
-                and rsi > 60 and rsi < prev_rsi):  # RSI overbought and falling
-                
-                # Calculate signal strength factors
-                strength_factors = [
-                    0.3,  # Base strength
-                    0.2 if volume_surge else 0,  # Add strength if volume surges
-                    0.3 if rsi > 70 else 0.1,  # Add strength if RSI is very high
-                    0.2 * (1 - (level_618 - current_price) / (level_618 - level_1))  # Proximity to resistance increases strength
-                ]
-                
-                strength = min(1.0, sum(strength_factors))  # Calculate total strength
-                reason = f"Swing Trade SELL: Near Fibonacci resistance {level_618:.2f}"  # Reason for the signal
-                return Signal('SELL', current_price, reason, strength)  # Return the SELL signal
-                
-            return None  # No signal generated
-            
-        except Exception as e:
-            print(f"Swing strategy error: {e}")  # Log any errors
-            return None
\ No newline at end of file
+        # Ensure there is enough data (and computed indicators) for
+        # analysis; the broad exception handler that used to swallow a
+        # missing-column KeyError is gone
+        if len(df) < 20 or 'RSI' not in df.columns:
+            return None
+
+        # Get the current price and volume
+        current_price = df['Close'].values[-1]
+        current_volume = df['Volume'].values[-1]
+        # Tail reductions: only the last window of each rolling
+        # statistic is ever read, so compute just that
+        avg_volume = df['Volume'].values[-20:].mean()
+        rsi_arr = df['RSI'].values
+        rsi = rsi_arr[-1]
+        prev_rsi = rsi_arr[-2]
+
+        # Cheapest gate first, as in swing_trade_strategy: no signal
+        # can fire without one of these RSI patterns
+        if not ((rsi < 40 and rsi > prev_rsi)
+                or (rsi > 60 and rsi < prev_rsi)):
+            return None
+
+        # Calculate Fibonacci retracement levels
+        fib_levels = TradingStrategies.fibonacci_retracement(df)
+        level_0, level_236, level_382, level_618, level_1 = fib_levels
+
+        # Check for volume confirmation (surge)
+        volume_surge = current_volume > (1.5 * avg_volume)
+
+        # Trend confirmation using recent lows and highs
+        lows = df['Low'].values
+        highs = df['High'].values
+        higher_lows = lows[-5:].min() > lows[-9:-4].min()  # Check for higher lows
+        lower_highs = highs[-5:].max() < highs[-9:-4].max()  # Check for lower highs
+
+        # BUY Signal Conditions
+        if (current_price <= level_382  # Price near Fibonacci support level
+            and higher_lows  # Confirm upward trend
+            and rsi < 40 and rsi > prev_rsi):  # RSI oversold but rising
+
+            # Calculate signal strength factors
+            strength_factors = [
+                0.3,  # Base strength
+                0.2 if volume_surge else 0,  # Add strength if volume surges
+                0.3 if rsi < 30 else 0.1,  # Add strength if RSI is very low
+                0.2 * (1 - (current_price - level_382) / (level_0 - level_382))  # Proximity to support increases strength
+            ]
+
+            strength = min(1.0, sum(strength_factors))  # Calculate total strength
+            reason = f"Swing Trade BUY: Near Fibonacci support {level_382:.2f}"  # Reason for the signal
+            return Signal('BUY', current_price, reason, strength)  # Return the BUY signal
+
+        # SELL Signal Conditions
+        elif (current_price >= level_618  # Price near Fibonacci resistance level
+            and lower_highs  # Confirm downward trend
+            and rsi > 60 and rsi < prev_rsi):  # RSI overbought and falling
+
+            # Calculate signal strength factors
+            strength_factors = [
+                0.3,  # Base strength
+                0.2 if volume_surge else 0,  # Add strength if volume surges
+                0.3 if rsi > 70 else 0.1,  # Add strength if RSI is very high
+                0.2 * (1 - (level_618 - current_price) / (level_618 - level_1))  # Proximity to resistance increases strength
+            ]
+
+            strength = min(1.0, sum(strength_factors))  # Calculate total strength
+            reason = f"Swing Trade SELL: Near Fibonacci resistance {level_618:.2f}"  # Reason for the signal
+            return Signal('SELL', current_price, reason, strength)  # Return the SELL signal
+
+        return None  # No signal generated
+
+
+@njit(cache=True)
+def _find_pivots_loop(lows, highs, volumes, window):
+    """Compiled twin of the find_support_resistance pivot scan.
+
+    Keeps the original loop's semantics exactly — the `not (a <= b)`
+    form makes NaN bars disqualify a pivot just like the old all(...)
+    comparisons did — but runs as native code with early-exit inner
+    loops and a running volume sum. Returns preallocated result arrays
+    with their fill counts: (supports, n_sup, resistances, n_res).
+    """
+    n = lows.shape[0]
+    supports = np.empty(n)
+    resistances = np.empty(n)
+    n_sup = 0
+    n_res = 0
+    span = 2 * window
+
+    vol_sum = 0.0
+    for j in range(span):
+        vol_sum += volumes[j]
+
+    for i in range(window, n - window):
+        if i > window:
+            # Slide the 2*window volume sum along with the pivot
+            vol_sum += volumes[i + window - 1] - volumes[i - window - 1]
+        if volumes[i] > vol_sum / span:
+            low_i = lows[i]
+            is_sup = True
+            for j in range(i - window, i + window):
+                if not (low_i <= lows[j]):
+                    is_sup = False
+                    break
+            if is_sup:
+                supports[n_sup] = low_i
+                n_sup += 1
+
+            high_i = highs[i]
+            is_res = True
+            for j in range(i - window, i + window):
+                if not (high_i >= highs[j]):
+                    is_res = False
+                    break
+            if is_res:
+                resistances[n_res] = high_i
+                n_res += 1
+    return supports, n_sup, resistances, n_res
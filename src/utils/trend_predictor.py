@@ -1,6 +1,14 @@
+import logging
 from typing import Tuple
 import numpy as np
-from scipy import stats
+
+log = logging.getLogger(__name__)
+
+# Centered x values and their sum of squares for the fixed 10-point
+# regression in _analyze_price_pattern; precomputed once so each call
+# is just a few dot products
+_X10C = np.arange(10, dtype=np.float64) - 4.5
+_SXX10 = float((_X10C * _X10C).sum())
 
 class TrendPredictor:
     """
@@ -18,22 +26,43 @@ class TrendPredictor:
         - strength: 0-1 score indicating prediction strength
         - reason: Explanation of the prediction
         """
+        # The sub-analyses guard their own inputs explicitly; this is
+        # the single safety net, and it keeps the full traceback
+        try:
+            return TrendPredictor._predict_trend(df)
+        except Exception:
+            log.exception("Trend prediction failed")
+            return "SIDEWAYS", 0.0, "Prediction error"
+
+    @staticmethod
+    def _predict_trend(df) -> Tuple[str, float, str]:
+        # Extract each column's ndarray once; the sub-analyses share
+        # these instead of each doing its own pandas lookups. Missing
+        # indicator columns become empty arrays, which the analyses
+        # treat as no data (same sideways fallback as before).
+        closes = df['Close'].values
+        rsi_arr = df['RSI'].values if 'RSI' in df.columns else np.empty(0)
+        macd_arr = df['MACD'].values if 'MACD' in df.columns else np.empty(0)
+        sig_arr = (df['MACD_signal'].values
+                   if 'MACD_signal' in df.columns else np.empty(0))
+
         # Collect various trend signals
         signals = []
         confidences = []
-        
+
         # 1. Moving Average Analysis
-        ma_direction, ma_confidence = TrendPredictor._analyze_moving_averages(df)
+        ma_direction, ma_confidence = TrendPredictor._analyze_moving_averages(closes)
         signals.append(ma_direction)
         confidences.append(ma_confidence)
-        
+
         # 2. Momentum Analysis
-        mom_direction, mom_confidence = TrendPredictor._analyze_momentum(df)
+        mom_direction, mom_confidence = TrendPredictor._analyze_momentum(
+            rsi_arr, macd_arr, sig_arr)
         signals.append(mom_direction)
         confidences.append(mom_confidence)
-        
+
         # 3. Price Pattern Analysis
-        pattern_direction, pattern_confidence = TrendPredictor._analyze_price_pattern(df)
+        pattern_direction, pattern_confidence = TrendPredictor._analyze_price_pattern(closes)
         signals.append(pattern_direction)
         confidences.append(pattern_confidence)
         
@@ -43,79 +72,90 @@ class TrendPredictor:
         return direction, strength, reason
 
     @staticmethod
-    def _analyze_moving_averages(df) -> Tuple[str, float]:
-        """Analyzes trend using moving averages"""
-        try:
-            # Compare different timeframe MAs
-            ma20 = df['Close'].rolling(window=20).mean().iloc[-1]
-            ma50 = df['Close'].rolling(window=50).mean().iloc[-1]
-            current_price = df['Close'].iloc[-1]
-            
-            # Calculate trend direction and strength
-            if current_price > ma20 > ma50:
-                return "UP", min(1.0, (current_price - ma50) / ma50)
-            elif current_price < ma20 < ma50:
-                return "DOWN", min(1.0, (ma50 - current_price) / current_price)
-            else:
-                return "SIDEWAYS", 0.3
-                
-        except Exception as e:
-            print(f"MA Analysis error: {e}")
-            return "SIDEWAYS", 0.0
+    def _analyze_moving_averages(closes) -> Tuple[str, float]:
+        """Analyzes trend using moving averages over the Close ndarray"""
+        if len(closes) < 50:
+            # The old rolling MAs were NaN here, which always fell
+            # through to the sideways branch
+            return "SIDEWAYS", 0.3
+
+        # Only the last value of each rolling MA is used, so compute
+        # the two tail means directly instead of full rolling series
+        ma20 = closes[-20:].mean()
+        ma50 = closes[-50:].mean()
+        current_price = closes[-1]
+
+        # Calculate trend direction and strength
+        if current_price > ma20 > ma50:
+            return "UP", min(1.0, (current_price - ma50) / ma50)
+        elif current_price < ma20 < ma50:
+            return "DOWN", min(1.0, (ma50 - current_price) / current_price)
+        else:
+            return "SIDEWAYS", 0.3
 
     @staticmethod
-    def _analyze_momentum(df) -> Tuple[str, float]:
-        """Analyzes trend using momentum indicators"""
-        try:
-            # Use RSI for momentum
-            rsi = df['RSI'].iloc[-1]
-            
-            # Strong momentum signals
-            if rsi > 70:
-                return "UP", min(1.0, (rsi - 70) / 30)
-            elif rsi < 30:
-                return "DOWN", min(1.0, (30 - rsi) / 30)
-            
-            # Check MACD for additional confirmation
-            macd = df['MACD'].iloc[-1]
-            signal = df['MACD_signal'].iloc[-1]
-            
-            if macd > signal:
-                return "UP", min(1.0, abs(macd - signal))
-            elif macd < signal:
-                return "DOWN", min(1.0, abs(macd - signal))
-            else:
-                return "SIDEWAYS", 0.3
-                
-        except Exception as e:
-            print(f"Momentum Analysis error: {e}")
+    def _analyze_momentum(rsi_arr, macd_arr, sig_arr) -> Tuple[str, float]:
+        """Analyzes trend using the RSI and MACD ndarrays"""
+        # Missing indicator columns arrive as empty arrays
+        if len(rsi_arr) == 0:
+            return "SIDEWAYS", 0.0
+
+        # Use RSI for momentum
+        rsi = rsi_arr[-1]
+
+        # Strong momentum signals
+        if rsi > 70:
+            return "UP", min(1.0, (rsi - 70) / 30)
+        elif rsi < 30:
+            return "DOWN", min(1.0, (30 - rsi) / 30)
+
+        # Check MACD for additional confirmation
+        if len(macd_arr) == 0 or len(sig_arr) == 0:
             return "SIDEWAYS", 0.0
+        macd = macd_arr[-1]
+        signal = sig_arr[-1]
+
+        if macd > signal:
+            return "UP", min(1.0, abs(macd - signal))
+        elif macd < signal:
+            return "DOWN", min(1.0, abs(macd - signal))
+        else:
+            return "SIDEWAYS", 0.3
 
     @staticmethod
-    def _analyze_price_pattern(df) -> Tuple[str, float]:
+    def _analyze_price_pattern(closes) -> Tuple[str, float]:
         """Analyzes recent price pattern for trend prediction"""
-        try:
-            # Get recent price data
-            recent_prices = df['Close'].tail(10).values
-            
-            # Calculate linear regression
-            x = np.arange(len(recent_prices))
-            slope, _, r_value, _, _ = stats.linregress(x, recent_prices)
-            
-            # Determine trend direction and strength based on slope and R-squared
-            r_squared = r_value ** 2
-            
-            if slope > 0:
-                return "UP", min(1.0, r_squared)
-            elif slope < 0:
-                return "DOWN", min(1.0, r_squared)
-            else:
-                return "SIDEWAYS", min(1.0, r_squared)
-                
-        except Exception as e:
-            print(f"Pattern Analysis error: {e}")
+        # A regression needs at least two points (linregress used to
+        # raise here, which fell back to the same sideways answer)
+        if len(closes) < 2:
             return "SIDEWAYS", 0.0
 
+        # Get recent price data
+        y = closes[-10:].astype(np.float64)
+
+        # Closed-form least squares: for a fixed x = 0..9 the slope
+        # and r-squared reduce to dot products against the
+        # precomputed centered x, replacing scipy.stats.linregress
+        # (which carries real per-call overhead for 10 points)
+        if y.shape[0] == 10:
+            xc, sxx = _X10C, _SXX10
+        else:
+            x = np.arange(y.shape[0], dtype=np.float64)
+            xc = x - x.mean()
+            sxx = (xc * xc).sum()
+        yc = y - y.mean()
+        sxy = (xc * yc).sum()
+        syy = (yc * yc).sum()
+        slope = sxy / sxx
+        r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 0.0
+
+        if slope > 0:
+            return "UP", min(1.0, r_squared)
+        elif slope < 0:
+            return "DOWN", min(1.0, r_squared)
+        else:
+            return "SIDEWAYS", min(1.0, r_squared)
+
     @staticmethod
     def _combine_signals(signals: list, confidences: list) -> Tuple[str, float, str]:
         """Combines multiple signals into final prediction"""